@@ -1,20 +1,53 @@
 """
-Naive in-memory rate limiter dependency
+In-memory token-bucket rate limiter dependency
+
+State is per process: behind several uvicorn workers each worker keeps its
+own buckets. A shared limit needs an external store (e.g. Redis INCR+EXPIRE).
 """
 
 import time
-from typing import Dict
+from typing import Awaitable, Callable, Dict, Tuple
 from fastapi import HTTPException
 
 
-_BUCKETS: Dict[str, float] = {}
+def _sweep(buckets: Dict[str, Tuple[float, float]], now: float, idle_s: float) -> None:
+    # An idle bucket is full again, so dropping it loses nothing
+    for cid in [cid for cid, (_, last) in buckets.items() if last < now - idle_s]:
+        del buckets[cid]
+
+
+def rate_limit(capacity: float = 5.0, rate: float = 5.0) -> Callable[[str], Awaitable[None]]:
+    """
+    Build a dependency allowing bursts of `capacity` requests per client,
+    refilled at `rate` tokens per second.
 
+    The limits are fixed here rather than taken from the request, e.g.
+    `Depends(rate_limit(capacity=10, rate=2))`. Each limiter keeps its own
+    buckets.
+    """
+    if rate <= 0:
+        raise ValueError(f"rate must be positive, got {rate}")
+    if capacity < 1:
+        raise ValueError(f"capacity must be at least 1, got {capacity}")
 
-async def rate_limit(client_id: str = "global", interval_s: float = 0.2):
-    now = time.time()
-    last = _BUCKETS.get(client_id, 0.0)
-    if now - last < interval_s:
-        raise HTTPException(status_code=429, detail="Rate limit exceeded")
-    _BUCKETS[client_id] = now
+    # client_id -> (tokens left, last refill timestamp)
+    buckets: Dict[str, Tuple[float, float]] = {}
+    idle_s = 10 * capacity / rate
+    last_sweep = 0.0
 
+    async def dependency(client_id: str = "global") -> None:
+        # No await below: on the event loop this runs start to finish
+        # without interleaving, so the buckets need no lock
+        nonlocal last_sweep
+        # Monotonic clock: NTP adjustments can't produce negative intervals
+        now = time.monotonic()
+        tokens, last = buckets.get(client_id, (capacity, now))
+        tokens = min(capacity, tokens + (now - last) * rate)
+        if tokens < 1:
+            raise HTTPException(status_code=429, detail="Rate limit exceeded")
+        buckets[client_id] = (tokens - 1, now)
+        if now - last_sweep >= idle_s:
+            last_sweep = now
+            _sweep(buckets, now, idle_s)
 
+    return dependency
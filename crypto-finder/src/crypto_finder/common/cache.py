@@ -1,51 +1,168 @@
 """
 Lightweight caching utilities
 
-- In-memory LRU cache decorator
+- In-memory LRU cache decorators (functools.lru_cache / functools.cache re-exported)
 - File-based cache for expensive computations
 """
 
 import functools
 import hashlib
 import json
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import cache, lru_cache  # noqa: F401  (re-exported C implementations)
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Hashable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json otherwise
+    orjson = None
 
 CACHE_DIR = Path(".cache/crypto_finder")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Entries at least this large are parsed straight from a read-only mapping
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _feed(h: Any, value: Any) -> None:
+    # Type tag + length prefix keep ("ab", "c") and ("a", "bc") apart
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        tag, data = b"b", value
+    elif isinstance(value, str):
+        tag, data = b"s", value.encode()
+    else:
+        tag, data = b"r", repr(value).encode()
+    h.update(tag)
+    h.update(len(data).to_bytes(8, "little"))
+    h.update(data)
+
+
+def _disk_key(*args: Any, **kwargs: Any) -> str:
+    # Content key only, not a security boundary: BLAKE2b-128 is faster and
+    # gives 32-char filenames
+    h = hashlib.blake2b(digest_size=16)
+    for arg in args:
+        _feed(h, arg)
+    for k, v in sorted(kwargs.items()):
+        h.update(b"\x00")
+        _feed(h, k)
+        _feed(h, v)
+    return h.hexdigest()
+
+
+def _mem_key(*args: Any, **kwargs: Any) -> Hashable:
+    # The args tuple itself keys the in-process layer: no serialization or
+    # digest. Types are part of the key since 1 == 1.0 == True would
+    # otherwise share an entry. Unhashable arguments fall back to the disk
+    # digest.
+    key = (
+        args,
+        tuple(map(type, args)),
+        tuple((k, v, type(v)) for k, v in sorted(kwargs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return _disk_key(*args, **kwargs)
+    return key
+
 
-def _hash_key(*args: Any, **kwargs: Any) -> str:
-    raw = json.dumps([args, sorted(kwargs.items())], default=str, separators=(",", ":"))
-    return hashlib.sha256(raw.encode()).hexdigest()
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=str).encode()
 
 
-def file_cache(namespace: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_entry(fp: Path) -> Any:
+    # Only orjson parses from a buffer; stdlib json needs real bytes anyway
+    if orjson is not None and fp.stat().st_size >= _MMAP_THRESHOLD:
+        with open(fp, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            return orjson.loads(view)
+    return _loads(fp.read_bytes())
+
+
+def _atomic_write(fp: Path, data: bytes) -> None:
+    # A crash mid-write leaves only the temp file; readers never see a partial entry.
+    # mkstemp gives each writer (process or thread) its own temp file.
+    fd, tmp = tempfile.mkstemp(dir=fp.parent, prefix=fp.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, fp)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def file_cache(namespace: str, mem_cache: int = 128) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Cache function results on disk using args as a key.
+
+    Results are stored as JSON; anything JSON can't represent (e.g. tuple
+    dict keys) is pickled to a `.pkl` entry instead. The `mem_cache` most
+    recently used results are also kept in process memory so warm calls
+    skip the disk entirely (0 disables the memory layer). Memory hits
+    return the same object to every caller, so treat results as read-only.
     """
     ns_dir = CACHE_DIR / namespace
     ns_dir.mkdir(parents=True, exist_ok=True)
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            key = _hash_key(*args, **kwargs)
+        memo: "OrderedDict[Hashable, Any]" = OrderedDict()
+        lock = threading.Lock()
+
+        def load_or_compute(key: str, args: tuple, kwargs: dict) -> Any:
             fp = ns_dir / f"{key}.json"
+            pkl = ns_dir / f"{key}.pkl"
             if fp.exists():
                 try:
-                    return json.loads(fp.read_text())
+                    return _read_entry(fp)
+                except Exception:
+                    pass
+            elif pkl.exists():
+                try:
+                    return pickle.loads(pkl.read_bytes())
                 except Exception:
                     pass
             result = func(*args, **kwargs)
             try:
-                fp.write_text(json.dumps(result, default=str))
+                _atomic_write(fp, _dumps(result))
             except Exception:
-                pass
+                try:
+                    _atomic_write(pkl, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+                except Exception:
+                    pass
             return result
-        return wrapper
-    return decorator
 
-
-def lru_cache(maxsize: int = 128) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    return functools.lru_cache(maxsize=maxsize)
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            mkey = _mem_key(*args, **kwargs) if mem_cache > 0 else None
+            if mkey is not None:
+                with lock:
+                    if mkey in memo:
+                        memo.move_to_end(mkey)
+                        return memo[mkey]
+            result = load_or_compute(_disk_key(*args, **kwargs), args, kwargs)
+            if mkey is not None:
+                with lock:
+                    memo[mkey] = result
+                    memo.move_to_end(mkey)
+                    if len(memo) > mem_cache:
+                        memo.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
\ No newline at end of file
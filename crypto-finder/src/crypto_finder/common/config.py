@@ -7,14 +7,47 @@ Loads and validates configuration from multiple sources:
 - Command-line arguments
 """
 
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
 
 # Provide a project root and a simple settings container for compatibility
 ROOT_DIR = Path(__file__).resolve().parents[3]
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML keyed by (resolved path, mtime_ns, size); edited files get a new key
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict] = {}
+_YAML_CACHE_MAX = 32
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML file, reusing the previous parse if the file is unchanged
+    
+    Args:
+        path: YAML file to load
+    
+    Returns:
+        A fresh copy of the parsed mapping (callers may mutate it)
+    """
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    
+    cached = _YAML_CACHE.get(key)
+    if cached is None:
+        with open(path, 'r') as f:
+            cached = yaml.load(f, Loader=_YamlLoader) or {}
+        if len(_YAML_CACHE) >= _YAML_CACHE_MAX:
+            # FIFO eviction: dicts keep insertion order
+            del _YAML_CACHE[next(iter(_YAML_CACHE))]
+        _YAML_CACHE[key] = cached
+    
+    return copy.deepcopy(cached)
+
 
 def load_config(config_path: str, environment: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -32,16 +65,14 @@ def load_config(config_path: str, environment: Optional[str] = None) -> Dict[str
     if not config_file.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
     
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f) or {}
+    config = _load_yaml(config_file)
     
     # Load environment-specific config if specified
     if environment:
         env_config_path = config_file.parent / f"{environment}.yaml"
         if env_config_path.exists():
-            with open(env_config_path, 'r') as f:
-                env_config = yaml.safe_load(f) or {}
-                config = merge_configs(config, env_config)
+            env_config = _load_yaml(env_config_path)
+            config = merge_configs(config, env_config)
     
     # Override with environment variables if present
     config = apply_env_overrides(config)
@@ -51,7 +82,7 @@ def load_config(config_path: str, environment: Optional[str] = None) -> Dict[str
 
 def merge_configs(base: Dict, override: Dict) -> Dict:
     """
-    Recursively merge two configuration dictionaries
+    Deep-merge two configuration dictionaries
     
     Args:
         base: Base configuration
@@ -60,23 +91,57 @@ def merge_configs(base: Dict, override: Dict) -> Dict:
     Returns:
         Merged configuration
     """
-    result = base.copy()
+    # One deep copy up front, then merge level by level in place
+    result = copy.deepcopy(base)
+    stack = [(result, override)]
     
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                stack.append((dst[key], value))
+            else:
+                dst[key] = value
     
     return result
 
 
+ENV_PREFIX = "CRYPTO_FINDER_"
+
+# (key path, parsed value) for every CRYPTO_FINDER_* variable, built once below
+_ENV_OVERRIDES: List[Tuple[List[str], Any]] = []
+
+
+def _env_key_path(name: str) -> List[str]:
+    # '__' separates sections explicitly, so keys may contain '_' themselves:
+    # MODEL__BATCH_SIZE -> ['model', 'batch_size']; MODEL_BATCH -> ['model', 'batch']
+    name = name.lower()
+    if '__' in name:
+        return name.split('__')
+    return name.split('_')
+
+
+def refresh_env_overrides() -> None:
+    """
+    Re-read CRYPTO_FINDER_* variables from the environment
+    
+    The scan runs once at import; call this after changing os.environ at runtime.
+    """
+    _ENV_OVERRIDES[:] = [
+        (_env_key_path(env_key[len(ENV_PREFIX):]), parse_env_value(env_value))
+        for env_key, env_value in os.environ.items()
+        if env_key.startswith(ENV_PREFIX)
+    ]
+
+
 def apply_env_overrides(config: Dict) -> Dict:
     """
     Apply environment variable overrides
     
     Environment variables in format: CRYPTO_FINDER_<SECTION>_<KEY>=value
     Example: CRYPTO_FINDER_MODEL_BATCH_SIZE=64
+    Use '__' between sections when a key itself contains '_':
+    CRYPTO_FINDER_MODEL__BATCH_SIZE=64 sets config['model']['batch_size']
     
     Args:
         config: Configuration dictionary
@@ -84,23 +149,16 @@ def apply_env_overrides(config: Dict) -> Dict:
     Returns:
         Configuration with environment overrides applied
     """
-    prefix = "CRYPTO_FINDER_"
-    
-    for env_key, env_value in os.environ.items():
-        if env_key.startswith(prefix):
-            # Parse the key path
-            key_path = env_key[len(prefix):].lower().split('_')
-            
-            # Navigate to the right place in config
-            current = config
-            for key in key_path[:-1]:
-                if key not in current or not isinstance(current.get(key), dict):
-                    current[key] = {}
-                current = current[key]
-            
-            # Set the value (try to parse as appropriate type)
-            final_key = key_path[-1]
-            current[final_key] = parse_env_value(env_value)
+    for key_path, value in _ENV_OVERRIDES:
+        # Navigate to the right place in config
+        current = config
+        for key in key_path[:-1]:
+            if key not in current or not isinstance(current.get(key), dict):
+                current[key] = {}
+            current = current[key]
+        
+        # Lists are copied so configs don't share one parsed object
+        current[key_path[-1]] = list(value) if isinstance(value, list) else value
     
     return config
 
@@ -141,6 +199,9 @@ def parse_env_value(value: str) -> Any:
     return value
 
 
+refresh_env_overrides()
+
+
 def save_config(config: Dict, output_path: str):
     """
     Save configuration to YAML file
@@ -174,6 +235,7 @@ settings = SimpleNamespace(
 # Yeh settings ko validate karta hai aur ensure karta hai ki sab aasaani se accessible ho.
 
 import os
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import DirectoryPath
 from pathlib import Path
@@ -212,10 +274,15 @@ class Settings(BaseSettings):
     def __init__(self, **values):
         super().__init__(**values)
         # Yeh directories ensure karti hain ki exist karti hain.
-        self.data_dir.mkdir(exist_ok=True)
-        self.raw_data_dir.mkdir(exist_ok=True)
-        self.processed_data_dir.mkdir(exist_ok=True)
-        self.models_dir.mkdir(exist_ok=True)
+        for d in (self.data_dir, self.raw_data_dir, self.processed_data_dir, self.models_dir):
+            d.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache()
+def get_settings() -> Settings:
+    """Validated Settings ka ek hi instance; .env dobara parse nahi hota."""
+    return Settings()
+
 
 # Ek global settings object jo pure application me use hoga.
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -3,15 +3,18 @@ Centralized logging configuration
 
 Provides consistent logging across all modules with:
 - Colored console output
-- File logging with rotation
+- File logging with rotation (buffered, flushed in batches or on ERROR)
 - Structured logging for analysis
 """
 
 import logging
+import multiprocessing
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from typing import Callable, Iterator, Optional, Tuple
 
 
 # ANSI color codes for terminal output
@@ -37,41 +40,43 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': LogColors.MAGENTA,
     }
     
+    def __init__(self, *args, stream=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        stream = stream if stream is not None else sys.stderr
+        isatty = getattr(stream, 'isatty', None)
+        # Colored level names built once; empty (plain output) when not a terminal
+        if isatty is not None and isatty():
+            self._colored = {lvl: f"{c}{lvl}{LogColors.RESET}" for lvl, c in self.COLORS.items()}
+        else:
+            self._colored = {}
+    
     def format(self, record):
-        # Add color to level name
+        if not self._colored:
+            return super().format(record)
+        # Records are shared between handlers, so restore the plain level name
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{LogColors.RESET}"
-        
-        return super().format(record)
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
-def setup_logging(
-    name: str,
-    level: str = "INFO",
-    log_dir: Optional[str] = "logs",
-    console: bool = True,
-    file_logging: bool = True
-) -> logging.Logger:
-    """
-    Setup logging for a module
-    
-    Args:
-        name: Logger name (usually __name__)
-        level: Logging level (DEBUG, INFO, WARNING, ERROR)
-        log_dir: Directory for log files
-        console: Enable console output
-        file_logging: Enable file logging
-    
-    Returns:
-        Configured logger instance
-    """
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
-    
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
+_configured = False
+_attached = False
+_root_level = logging.INFO
+_configure_lock = threading.Lock()
+
+
+def _attach_root_handlers(
+    level: str,
+    log_dir: Optional[str],
+    console: bool,
+    file_logging: bool
+) -> None:
+    """Attach console/file handlers to the root logger"""
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper()))
     
     # Format string
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -81,9 +86,9 @@ def setup_logging(
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG)
-        console_formatter = ColoredFormatter(log_format, datefmt=date_format)
+        console_formatter = ColoredFormatter(log_format, datefmt=date_format, stream=sys.stdout)
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        root.addHandler(console_handler)
     
     # File handler with rotation
     if file_logging and log_dir:
@@ -91,29 +96,154 @@ def setup_logging(
         log_path.mkdir(parents=True, exist_ok=True)
         
         # General log file
+        # delay=True: the file is only opened on the first write
         file_handler = RotatingFileHandler(
             log_path / 'crypto_finder.log',
             maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            delay=True
         )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(log_format, datefmt=date_format)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
         
-        # Error-specific log file
+        # Buffer records and write them in batches; ERROR and above flush at once
+        buffered_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        root.addHandler(buffered_handler)
+        
+        # Error-specific log file (only ERROR records, so not worth buffering)
         error_handler = RotatingFileHandler(
             log_path / 'errors.log',
             maxBytes=10*1024*1024,
-            backupCount=5
+            backupCount=5,
+            delay=True
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        logger.addHandler(error_handler)
+        root.addHandler(error_handler)
+
+
+class _DeferredRootHandler(logging.Handler):
+    """
+    Stand-in on the root logger until a record is actually emitted
+
+    Importing a module only records the output options; the console/file
+    handlers (and the log directory) are created when the first record
+    reaches the root, which then goes to them as usual.
+    """
+
+    def __init__(self, level: str, log_dir: Optional[str], console: bool, file_logging: bool):
+        super().__init__()
+        self._options = (level, log_dir, console, file_logging)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        global _attached
+        root = logging.getLogger()
+        with _configure_lock:
+            if not _attached:
+                # Logger.callHandlers is iterating the current list: swap in a
+                # new one so the handlers attached below aren't visited twice
+                before = [h for h in root.handlers if h is not self]
+                root.handlers = list(before)
+                _attach_root_handlers(*self._options)
+                _attached = True
+                fresh = [h for h in root.handlers if h not in before]
+            else:
+                fresh = []
+        for handler in fresh:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - handle() covers it
+        pass
+
+
+def setup_logging(
+    name: str,
+    level: str = "INFO",
+    log_dir: Optional[str] = "logs",
+    console: bool = True,
+    file_logging: bool = True
+) -> logging.Logger:
+    """
+    Setup logging for a module
+    
+    Handlers are attached to the root logger once, when the first record
+    is emitted, with the options of the first call; module loggers
+    propagate to them, so a record is written once no matter how many
+    modules call this. Output options of later calls are ignored. Calling
+    this at import time therefore opens no files and creates no log dir.
+    
+    Args:
+        name: Logger name (usually __name__)
+        level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        log_dir: Directory for log files
+        console: Enable console output
+        file_logging: Enable file logging
+    
+    Returns:
+        Configured logger instance
+    """
+    global _configured, _root_level
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, level.upper()))
+    
+    if not _configured:
+        with _configure_lock:
+            if not _configured:
+                logging.getLogger().addHandler(
+                    _DeferredRootHandler(level, log_dir, console, file_logging)
+                )
+                _root_level = getattr(logging, level.upper())
+                _configured = True
     
     return logger
 
 
+class _ForwardHandler(logging.Handler):
+    """Hand records from worker processes to the parent's logger tree"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker_logging(queue, level: int) -> None:
+    global _configured, _attached
+    root = logging.getLogger()
+    # Handlers inherited over fork hold the parent's files and its unflushed
+    # MemoryHandler buffer; pool workers leave via os._exit and never flush
+    root.handlers = [QueueHandler(queue)]
+    root.setLevel(level)
+    _configured = _attached = True
+
+
+@contextmanager
+def worker_logging() -> Iterator[Tuple[Callable[..., None], tuple]]:
+    """
+    (initializer, initargs) for a process pool whose workers log via the parent
+
+    Worker records travel over a queue and are written by this process's
+    handlers, so nothing is lost when a worker exits:
+
+        with worker_logging() as (init, args), ProcessPoolExecutor(initializer=init, initargs=args) as ex:
+            ...
+    """
+    queue = multiprocessing.Queue()
+    listener = QueueListener(queue, _ForwardHandler())
+    listener.start()
+    try:
+        yield _init_worker_logging, (queue, _root_level)
+    finally:
+        listener.stop()
+        queue.close()
+
+
 # Provide a global logger with a custom SUCCESS level for compatibility
 SUCCESS_LEVEL_NUM = 25  # Between INFO (20) and WARNING (30)
 if not hasattr(logging, 'SUCCESS'):
@@ -127,40 +257,26 @@ def _success(self, message, *args, **kws):
 
 logging.Logger.success = _success  # type: ignore[attr-defined]
 
-# Global logger used by modules that import `log`
-log = setup_logging("crypto_finder")
 
-# Hinglish: Loguru ka use karke ek behtar aur modern logging setup.
-# Isse logging karna aasaan aur powerful ho jaata hai.
+def _ensure_configured() -> None:
+    """Record the default output options on first use of `log`"""
+    if not _configured:
+        setup_logging("crypto_finder")
 
-import sys
-from loguru import logger
-
-def setup_logging():
-    """Application ke liye logging ko configure karta hai."""
-    # Pehle se मौजूद saare handlers ko remove karo.
-    logger.remove()
-
-    # Console (terminal) me log karne ke liye ek naya handler add karo.
-    # Iska format behtar readability ke liye set kiya gaya hai.
-    logger.add(
-        sys.stderr,
-        level="DEBUG",
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        colorize=True,
-    )
-    
-    # File me log karne ke liye ek handler (optional, agar zaroorat pade).
-    # logger.add(
-    #     "logs/app.log",
-    #     level="DEBUG",
-    #     rotation="10 MB", # Har 10 MB ke baad nayi file.
-    #     retention="10 days", # 10 din purane logs delete.
-    #     format="{time} {level} {message}",
-    # )
-
-    logger.info("Logger successfully configured.")
-    return logger
 
-# Ek global logger object jo pure application me use hoga.
-log = setup_logging()
+class _LazyLogger(logging.LoggerAdapter):
+    """
+    Package logger that defers handler setup (log dir, files) until the
+    first record is emitted, so importing a module costs no I/O
+    """
+
+    def log(self, level, msg, *args, **kwargs):
+        _ensure_configured()
+        super().log(level, msg, *args, **kwargs)
+
+    def success(self, msg, *args, **kwargs):
+        self.log(SUCCESS_LEVEL_NUM, msg, *args, **kwargs)
+
+
+# Global logger used by modules that import `log`
+log = _LazyLogger(logging.getLogger("crypto_finder"), {})
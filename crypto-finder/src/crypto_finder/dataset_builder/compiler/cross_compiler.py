@@ -7,14 +7,32 @@ Compiles crypto libraries for multiple target architectures:
 - Multiple compilers (GCC, Clang)
 """
 
+import asyncio
+import os
 import subprocess
 import shutil
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import hashlib
 import json
 from tqdm import tqdm
 
+# Optional fast hashers; the fingerprint is a content tag, not a security check
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json otherwise
+    orjson = None
+
 from crypto_finder.common.logging import setup_logging
 from crypto_finder.common.exceptions import CompilationError
 from .library_manager import LibraryManager
@@ -22,6 +40,15 @@ from .library_manager import LibraryManager
 logger = setup_logging(__name__)
 
 
+@lru_cache(maxsize=None)
+def _find_toolchain(cc: str) -> Optional[str]:
+    """
+    shutil.which, memoized per process so repeated CrossCompiler instances
+    don't re-walk PATH
+    """
+    return shutil.which(cc)
+
+
 class CrossCompiler:
     """
     Manages cross-compilation of crypto libraries
@@ -83,6 +110,15 @@ class CrossCompiler:
         self.workspace = Path(workspace_dir)
         self.workspace.mkdir(parents=True, exist_ok=True)
         
+        # ccache wraps the compiler when installed; rebuilds then hit its cache
+        self.ccache = _find_toolchain('ccache')
+        self.ccache_dir = self.workspace / '.ccache'
+        if self.ccache:
+            logger.info(f"Using ccache: {self.ccache} (cache dir: {self.ccache_dir})")
+        
+        # lld links noticeably faster than bfd and is multithreaded by default
+        self.lld = _find_toolchain('ld.lld')
+        
         # Check available toolchains
         self.available_archs = self._check_toolchains()
         logger.info(f"Available architectures: {', '.join(self.available_archs)}")
@@ -98,7 +134,7 @@ class CrossCompiler:
         
         for arch, config in self.ARCHITECTURES.items():
             cc = config['cc']
-            if shutil.which(cc):
+            if _find_toolchain(cc):
                 available.append(arch)
                 logger.debug(f"✓ {arch}: {cc} found")
             else:
@@ -109,33 +145,25 @@ class CrossCompiler:
         
         return available
     
-    def compile_file(
+    def _compiler_command(
         self,
-        source_file: str,
-        output_file: str,
         architecture: str,
-        optimization: str = '-O2',
+        optimization: str,
         compiler: str = 'gcc',
-        extra_flags: Optional[List[str]] = None
-    ) -> bool:
+        cached: bool = False
+    ) -> List[str]:
         """
-        Compile a single C/C++ source file
+        Build the compiler executable + target/optimization flags for an arch
         
         Args:
-            source_file: Path to source file
-            output_file: Where to save compiled binary
             architecture: Target architecture
             optimization: Optimization level
             compiler: Compiler to use (gcc or clang)
-            extra_flags: Additional compiler flags
+            cached: Prefix the compiler with ccache when it is available
         
         Returns:
-            True if compilation succeeded
+            Command prefix, without inputs or outputs
         """
-        if architecture not in self.available_archs:
-            logger.error(f"Architecture {architecture} not available")
-            return False
-        
         arch_config = self.ARCHITECTURES[architecture]
         
         # Build compiler command
@@ -151,67 +179,534 @@ class CrossCompiler:
         else:
             target_flag = ''
         
-        # Build flags list
         flags = [
             optimization,
             arch_config['cflags'],
             target_flag,
-            '-static',  # Create standalone binary
-            '-fno-stack-protector',  # Disable stack protection for analysis
-            '-o', output_file,
-            source_file
         ]
         
-        if extra_flags:
-            flags.extend(extra_flags)
-        
         # Remove empty flags
-        flags = [f for f in flags if f]
+        prefix = [self.ccache, cc] if cached and self.ccache else [cc]
+        return prefix + [f for f in flags if f]
+    
+    def _ccache_env(self, base_dir: str) -> Optional[Dict[str, str]]:
+        """
+        Environment for a ccache-wrapped compile
         
-        # Compile
-        cmd = [cc] + flags
+        CCACHE_BASEDIR makes absolute paths under the source tree relative, so
+        hits survive the library being extracted to a different directory.
         
+        Args:
+            base_dir: Root of the sources being compiled
+        
+        Returns:
+            Environment mapping, or None to inherit ours when ccache is absent
+        """
+        if not self.ccache:
+            return None
+        env = os.environ.copy()
+        env['CCACHE_DIR'] = str(self.ccache_dir.resolve())
+        env['CCACHE_BASEDIR'] = str(Path(base_dir).resolve())
+        return env
+    
+    def _run(
+        self,
+        cmd: List[str],
+        what: str,
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """
+        Run a compiler/linker command, logging failures
+        
+        Args:
+            cmd: Command to execute
+            what: Description used in log messages
+            cwd: Working directory for the command
+            env: Environment for the command (default: inherit)
+        
+        Returns:
+            True if the command exited with status 0
+        """
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
+                cwd=cwd,
+                env=env,
                 timeout=300  # 5 minute timeout
             )
             
-            if result.returncode == 0:
-                logger.debug(f"✓ Compiled: {output_file}")
-                return True
-            else:
-                logger.error(f"✗ Compilation failed: {result.stderr}")
-                return False
+            return self._check_result(result.returncode, result.stderr, what)
         
         except subprocess.TimeoutExpired:
-            logger.error(f"✗ Compilation timeout: {source_file}")
+            logger.error(f"✗ Compilation timeout: {what}")
             return False
         except Exception as e:
             logger.error(f"✗ Compilation error: {e}")
             return False
     
+    async def _run_async(
+        self,
+        cmd: List[str],
+        what: str,
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """
+        Async counterpart of _run using asyncio subprocesses
+        
+        Only stderr is piped; stdout goes to /dev/null since nothing reads it.
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                env=env
+            )
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(), timeout=300)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                logger.error(f"✗ Compilation timeout: {what}")
+                return False
+            
+            return self._check_result(proc.returncode, stderr.decode(errors='replace'), what)
+        
+        except Exception as e:
+            logger.error(f"✗ Compilation error: {e}")
+            return False
+    
+    @staticmethod
+    def _check_result(returncode: int, stderr: str, what: str) -> bool:
+        if returncode == 0:
+            logger.debug(f"✓ Compiled: {what}")
+            return True
+        else:
+            logger.error(f"✗ Compilation failed: {stderr}")
+            return False
+    
+    def compile_file(
+        self,
+        source_file: str,
+        output_file: str,
+        architecture: str,
+        optimization: str = '-O2',
+        compiler: str = 'gcc',
+        extra_flags: Optional[List[str]] = None,
+        static: bool = False
+    ) -> bool:
+        """
+        Compile a single C/C++ source file
+        
+        Args:
+            source_file: Path to source file
+            output_file: Where to save compiled binary
+            architecture: Target architecture
+            optimization: Optimization level
+            compiler: Compiler to use (gcc or clang)
+            extra_flags: Additional compiler flags
+            static: Link statically (pulls in and relocates all of libc)
+        
+        Returns:
+            True if compilation succeeded
+        """
+        prepared = self._file_command(
+            source_file, output_file, architecture, optimization, compiler, extra_flags, static
+        )
+        if prepared is None:
+            return False
+        cmd, env = prepared
+        return self._run(cmd, output_file, env=env)
+    
+    async def compile_file_async(
+        self,
+        source_file: str,
+        output_file: str,
+        architecture: str,
+        optimization: str = '-O2',
+        compiler: str = 'gcc',
+        extra_flags: Optional[List[str]] = None,
+        static: bool = False
+    ) -> bool:
+        """
+        Async version of compile_file
+        """
+        prepared = self._file_command(
+            source_file, output_file, architecture, optimization, compiler, extra_flags, static
+        )
+        if prepared is None:
+            return False
+        cmd, env = prepared
+        return await self._run_async(cmd, output_file, env=env)
+    
+    def _file_command(
+        self,
+        source_file: str,
+        output_file: str,
+        architecture: str,
+        optimization: str,
+        compiler: str,
+        extra_flags: Optional[List[str]],
+        static: bool
+    ) -> Optional[Tuple[List[str], Optional[Dict[str, str]]]]:
+        """
+        Command and environment for compile_file, or None if arch unavailable
+        """
+        if architecture not in self.available_archs:
+            logger.error(f"Architecture {architecture} not available")
+            return None
+        
+        # Compiling and linking in one step: ccache only caches `-c`
+        cmd = self._compiler_command(architecture, optimization, compiler)
+        cmd += self._link_flags(static) + [
+            '-fno-stack-protector',  # Disable stack protection for analysis
+            '-o', output_file,
+            source_file
+        ]
+        
+        if extra_flags:
+            cmd.extend(extra_flags)
+        
+        return cmd, None
+    
+    def compile_batch(
+        self,
+        sources: List[str],
+        out_dir: str,
+        architecture: str,
+        optimization: str = '-O2',
+        compiler: str = 'gcc',
+        extra_flags: Optional[List[str]] = None
+    ) -> Dict[str, Path]:
+        """
+        Compile several source files to objects with one compiler invocation
+        
+        `-c` without `-o` makes the compiler write `<stem>.o` per input into
+        its working directory, so source stems must be unique within a batch.
+        ccache only caches single-source invocations, so compile_library
+        passes one source per batch when ccache is in use; those run from the
+        source's directory with an explicit `-o`, keeping ccache's view of
+        the working directory stable across runs.
+        
+        Args:
+            sources: Source files to compile
+            out_dir: Directory that receives the object files
+            architecture: Target architecture
+            optimization: Optimization level
+            compiler: Compiler to use (gcc or clang)
+            extra_flags: Additional compiler flags
+        
+        Returns:
+            Mapping of source path to object file, for sources that compiled
+        """
+        prepared = self._batch_command(
+            sources, out_dir, architecture, optimization, compiler, extra_flags
+        )
+        if prepared is None:
+            return {}
+        cmd, env, out_path, cwd = prepared
+        self._run(cmd, f"{len(sources)} sources -> {out_path}", cwd=cwd, env=env)
+        return self._collect_objects(sources, out_path)
+    
+    async def compile_batch_async(
+        self,
+        sources: List[str],
+        out_dir: str,
+        architecture: str,
+        optimization: str = '-O2',
+        compiler: str = 'gcc',
+        extra_flags: Optional[List[str]] = None
+    ) -> Dict[str, Path]:
+        """
+        Async version of compile_batch
+        """
+        prepared = self._batch_command(
+            sources, out_dir, architecture, optimization, compiler, extra_flags
+        )
+        if prepared is None:
+            return {}
+        cmd, env, out_path, cwd = prepared
+        await self._run_async(cmd, f"{len(sources)} sources -> {out_path}", cwd=cwd, env=env)
+        return self._collect_objects(sources, out_path)
+    
+    def _batch_command(
+        self,
+        sources: List[str],
+        out_dir: str,
+        architecture: str,
+        optimization: str,
+        compiler: str,
+        extra_flags: Optional[List[str]]
+    ) -> Optional[Tuple[List[str], Optional[Dict[str, str]], Path, Path]]:
+        """
+        Command, environment, object directory and working directory for
+        compile_batch
+        """
+        if architecture not in self.available_archs:
+            logger.error(f"Architecture {architecture} not available")
+            return None
+        
+        out_path = Path(out_dir)
+        # Batch dirs are reused across runs: clear them so a source that no
+        # longer compiles can't be "collected" from an old object
+        if out_path.exists():
+            shutil.rmtree(out_path)
+        out_path.mkdir(parents=True)
+        
+        cmd = self._compiler_command(architecture, optimization, compiler, cached=True) + [
+            '-fno-stack-protector',  # Disable stack protection for analysis
+            '-c',
+        ]
+        if extra_flags:
+            cmd.extend(extra_flags)
+        resolved = [Path(src).resolve() for src in sources]
+        
+        if len(resolved) == 1:
+            # CCACHE_BASEDIR rewrites paths relative to the working directory;
+            # the batch dir changes between runs, the source's own dir doesn't
+            src = resolved[0]
+            cwd = src.parent
+            cmd.extend(['-o', str(out_path.resolve() / f"{src.stem}.o"), str(src)])
+        else:
+            cwd = out_path
+            cmd.extend(str(src) for src in resolved)
+        
+        env = self._ccache_env(os.path.commonpath([str(src.parent) for src in resolved]))
+        return cmd, env, out_path, cwd
+    
+    @staticmethod
+    def _collect_objects(sources: List[str], out_path: Path) -> Dict[str, Path]:
+        # A failing file doesn't stop the others; keep whatever was produced
+        objects = {}
+        for src in sources:
+            obj = out_path / f"{Path(src).stem}.o"
+            if obj.exists():
+                objects[src] = obj
+        return objects
+    
+    def link_object(
+        self,
+        object_file: Path,
+        output_file: str,
+        architecture: str,
+        optimization: str = '-O2',
+        compiler: str = 'gcc',
+        static: bool = False
+    ) -> bool:
+        """
+        Link a compiled object into an executable
+        
+        Args:
+            object_file: Object produced by compile_batch
+            output_file: Where to save the binary
+            architecture: Target architecture
+            optimization: Optimization level (passed through to the driver)
+            compiler: Compiler driver to link with
+            static: Link statically (pulls in and relocates all of libc)
+        
+        Returns:
+            True if linking succeeded
+        """
+        cmd = self._link_command(object_file, output_file, architecture, optimization, compiler, static)
+        return self._run(cmd, output_file)
+    
+    async def link_object_async(
+        self,
+        object_file: Path,
+        output_file: str,
+        architecture: str,
+        optimization: str = '-O2',
+        compiler: str = 'gcc',
+        static: bool = False
+    ) -> bool:
+        """
+        Async version of link_object
+        """
+        cmd = self._link_command(object_file, output_file, architecture, optimization, compiler, static)
+        return await self._run_async(cmd, output_file)
+    
+    def _link_command(
+        self,
+        object_file: Path,
+        output_file: str,
+        architecture: str,
+        optimization: str,
+        compiler: str,
+        static: bool
+    ) -> List[str]:
+        return self._compiler_command(architecture, optimization, compiler) + self._link_flags(static) + [
+            '-o', output_file,
+            str(object_file)
+        ]
+    
+    def _link_flags(self, static: bool) -> List[str]:
+        flags = ['-static'] if static else []  # Standalone binary, opt-in
+        if self.lld:
+            flags.append('-fuse-ld=lld')
+        return flags
+    
     def compile_library(
         self,
         library_name: str,
         source_dir: str,
         functions: List[str],
-        output_dir: str
+        output_dir: str,
+        max_workers: Optional[int] = None,
+        static: bool = False,
+        link: bool = True
     ) -> Dict[str, Dict]:
         """
         Compile all functions from a library for all architectures
         
+        Sources are compiled to objects in batches (one compiler process per
+        ~2 x cpu_count sources of the same arch/opt, or per source under
+        ccache), then each function's binary is linked from its object. Both
+        phases run on a thread pool; the threads only wait on compiler
+        subprocesses.
+        
+        Binaries already built from identical source bytes and flags are
+        reused via `output_dir/cache.json` instead of being recompiled.
+        
+        Args:
+            library_name: Name of the library (e.g., 'openssl')
+            source_dir: Directory containing source files
+            functions: List of function names to compile
+            output_dir: Where to save compiled binaries
+            max_workers: Concurrent compiler processes (default: os.cpu_count())
+            static: Link binaries statically
+            link: Link at all; False keeps the `.o` objects, which is enough
+                for function extraction and skips the libc link entirely
+        
+        Returns:
+            Dictionary mapping (arch, opt, func) to binary info
+        """
+        workers = max_workers or os.cpu_count() or 1
+        plan = self._plan_library(library_name, source_dir, functions, output_dir, workers, static, link)
+        
+        with tqdm(total=plan['total'], desc=f"Compiling {library_name}") as pbar, \
+                ThreadPoolExecutor(max_workers=workers) as ex:
+            pbar.update(plan['skipped'])
+            
+            # Phase 1: batched compilation to objects
+            batch_futures = {
+                ex.submit(self.compile_batch, batch, str(obj_dir), arch, opt): (arch, opt)
+                for (arch, opt), batch, obj_dir in self._batch_jobs(plan)
+            }
+            
+            objects: Dict[Tuple[str, str], Dict[str, Path]] = {}
+            for future in as_completed(batch_futures):
+                objects.setdefault(batch_futures[future], {}).update(future.result())
+            
+            # Phase 2: link each function (or keep its object when link=False)
+            link_futures = []
+            for task, obj in self._link_jobs(plan, objects):
+                if obj is None:
+                    pbar.update(1)
+                    continue
+                link_futures.append(ex.submit(self._link_task, task, obj, static, link))
+            
+            for future in as_completed(link_futures):
+                self._record(plan, future.result())
+                pbar.update(1)
+        
+        return self._finish_library(plan)
+    
+    async def compile_library_async(
+        self,
+        library_name: str,
+        source_dir: str,
+        functions: List[str],
+        output_dir: str,
+        max_workers: Optional[int] = None,
+        static: bool = False,
+        link: bool = True
+    ) -> Dict[str, Dict]:
+        """
+        Async version of compile_library
+        
+        Drives up to `max_workers` compiler subprocesses from the event loop
+        instead of a thread pool. Run it with
+        `asyncio.run(compiler.compile_library_async(...))`.
+        
         Args:
             library_name: Name of the library (e.g., 'openssl')
             source_dir: Directory containing source files
             functions: List of function names to compile
             output_dir: Where to save compiled binaries
+            max_workers: Concurrent compiler processes (default: os.cpu_count())
+            static: Link binaries statically
+            link: Link at all; False keeps the `.o` objects, which is enough
+                for function extraction and skips the libc link entirely
         
         Returns:
             Dictionary mapping (arch, opt, func) to binary info
         """
+        workers = max_workers or os.cpu_count() or 1
+        plan = self._plan_library(library_name, source_dir, functions, output_dir, workers, static, link)
+        sem = asyncio.Semaphore(workers)
+        loop = asyncio.get_running_loop()
+        
+        with tqdm(total=plan['total'], desc=f"Compiling {library_name}") as pbar:
+            pbar.update(plan['skipped'])
+            
+            async def compile_one(key, batch, obj_dir):
+                async with sem:
+                    return key, await self.compile_batch_async(batch, str(obj_dir), *key)
+            
+            objects: Dict[Tuple[str, str], Dict[str, Path]] = {}
+            for key, objs in await asyncio.gather(
+                *(compile_one(*job) for job in self._batch_jobs(plan))
+            ):
+                objects.setdefault(key, {}).update(objs)
+            
+            async def link_one(task, obj):
+                if link:
+                    async with sem:
+                        ok = await self.link_object_async(
+                            obj, str(task[3]), task[4], task[5], static=static
+                        )
+                else:
+                    ok = await loop.run_in_executor(None, self._place_object, obj, task[3])
+                entry = None
+                if ok:
+                    # Fingerprinting reads the binary; keep it off the event loop
+                    entry = await loop.run_in_executor(None, self._binary_metadata, task)
+                pbar.update(1)
+                return entry
+            
+            link_jobs = []
+            for task, obj in self._link_jobs(plan, objects):
+                if obj is None:
+                    pbar.update(1)
+                    continue
+                link_jobs.append(link_one(task, obj))
+            
+            for entry in await asyncio.gather(*link_jobs):
+                self._record(plan, entry)
+        
+        return self._finish_library(plan)
+    
+    def _plan_library(
+        self,
+        library_name: str,
+        source_dir: str,
+        functions: List[str],
+        output_dir: str,
+        workers: int,
+        static: bool,
+        link: bool
+    ) -> Dict:
+        """
+        Resolve sources, restore cached binaries and group remaining work
+        
+        Returns:
+            Plan dict shared by compile_library and compile_library_async
+        """
         results = {}
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -224,95 +719,368 @@ class CrossCompiler:
         
         logger.info(f"Compiling {library_name}: {total_compilations} total compilations")
         
-        with tqdm(total=total_compilations, desc=f"Compiling {library_name}") as pbar:
-            for arch in self.available_archs:
-                for opt in self.OPTIMIZATION_LEVELS:
-                    for func_name in functions:
-                        # Find source file for this function
-                        source_file = self._find_source_file(source_dir, func_name)
-                        
-                        if not source_file:
-                            logger.warning(f"Source not found for {func_name}")
-                            pbar.update(1)
-                            continue
-                        
-                        # Generate output filename
-                        opt_clean = opt.replace('-', '').lower()
-                        output_file = (
-                            output_path / 
-                            f"{library_name}_{func_name}_{arch}_{opt_clean}.bin"
-                        )
-                        
-                        # Compile
-                        success = self.compile_file(
-                            source_file=source_file,
-                            output_file=str(output_file),
-                            architecture=arch,
-                            optimization=opt
-                        )
-                        
-                        if success:
-                            # Store metadata
-                            key = (arch, opt, func_name)
-                            results[key] = {
-                                'binary_path': str(output_file),
-                                'source_path': str(source_file),
-                                'architecture': arch,
-                                'optimization': opt,
-                                'function': func_name,
-                                'library': library_name,
-                                'size': output_file.stat().st_size,
-                                'md5': self._compute_md5(output_file)
-                            }
-                        
-                        pbar.update(1)
-        
-        logger.info(f"Compiled {len(results)}/{total_compilations} successfully")
+        # ccache can't cache multi-source invocations; let it see one file each
+        batch_size = 1 if self.ccache else 2 * workers
+        
+        manifest = self._load_manifest(output_path)
+        
+        # One tree walk and one lookup per function, shared by every arch/opt
+        index = self._index_sources(source_dir)
+        source_files = {
+            func_name: self._find_source_file(source_dir, func_name, index)
+            for func_name in functions
+        }
+        
+        suffix = '.bin' if link else '.o'
+        
+        # Build the full task list up front, grouped by (arch, opt)
+        tasks: Dict[Tuple[str, str], List[Tuple]] = {}
+        content_keys: Dict[Path, str] = {}
+        missing = 0
+        hits = 0
+        for arch in self.available_archs:
+            for opt in self.OPTIMIZATION_LEVELS:
+                for func_name in functions:
+                    # Find source file for this function
+                    source_file = source_files[func_name]
+                    
+                    if not source_file:
+                        logger.warning(f"Source not found for {func_name}")
+                        missing += 1
+                        continue
+                    
+                    # Generate output filename
+                    opt_clean = opt.replace('-', '').lower()
+                    output_file = (
+                        output_path / 
+                        f"{library_name}_{func_name}_{arch}_{opt_clean}{suffix}"
+                    )
+                    task = (library_name, func_name, source_file, output_file, arch, opt)
+                    
+                    # Reuse a binary built from the same source + command
+                    content_key = self._content_key(manifest, source_file, arch, opt, static, link)
+                    cached = self._restore_cached(manifest, content_key, task)
+                    if cached is not None:
+                        results[(arch, opt, func_name)] = cached
+                        hits += 1
+                        continue
+                    
+                    content_keys[output_file] = content_key
+                    tasks.setdefault((arch, opt), []).append(task)
+        
+        if hits:
+            logger.info(f"Reused {hits} cached binaries")
+        
+        return {
+            'library': library_name,
+            'output_path': output_path,
+            'manifest': manifest,
+            'paths': {e['binary_path']: k for k, e in manifest['entries'].items()},
+            'tasks': tasks,
+            'content_keys': content_keys,
+            'results': results,
+            'batch_size': batch_size,
+            'total': total_compilations,
+            'skipped': missing + hits,
+        }
+    
+    def _batch_jobs(self, plan: Dict):
+        """
+        Yield ((arch, opt), sources, object_dir) for each compile batch
+        """
+        for (arch, opt), group in plan['tasks'].items():
+            opt_clean = opt.replace('-', '').lower()
+            sources = list(dict.fromkeys(task[2] for task in group))
+            for i, batch in enumerate(self._split_batches(sources, plan['batch_size'])):
+                obj_dir = self.workspace / 'objects' / plan['library'] / arch / opt_clean / str(i)
+                yield (arch, opt), batch, obj_dir
+    
+    @staticmethod
+    def _link_jobs(plan: Dict, objects: Dict[Tuple[str, str], Dict[str, Path]]):
+        """
+        Yield (task, object file or None if its compile failed)
+        """
+        for key, group in plan['tasks'].items():
+            for task in group:
+                yield task, objects.get(key, {}).get(task[2])
+    
+    @staticmethod
+    def _record(plan: Dict, entry: Optional[Tuple[Tuple[str, str, str], Dict]]):
+        if entry is not None:
+            key, info = entry
+            plan['results'][key] = info
+            entries = plan['manifest']['entries']
+            content_key = plan['content_keys'][Path(info['binary_path'])]
+            # The file was rebuilt with other flags; forget what it used to be
+            stale = plan['paths'].get(info['binary_path'])
+            if stale is not None and stale != content_key:
+                entries.pop(stale, None)
+            entries[content_key] = info
+            plan['paths'][info['binary_path']] = content_key
+    
+    def _finish_library(self, plan: Dict) -> Dict[str, Dict]:
+        self._save_manifest(plan['output_path'], plan['manifest'])
+        results = plan['results']
+        logger.info(f"Compiled {len(results)}/{plan['total']} successfully")
         return results
     
-    def _find_source_file(self, source_dir: str, function_name: str) -> Optional[str]:
+    def _load_manifest(self, output_path: Path) -> Dict:
+        """
+        Load the compilation cache manifest from output_path/cache.json
+        
+        Returns:
+            Dict with 'entries' (content key -> binary metadata) and
+            'sources' (path -> [mtime_ns, size, sha256])
+        """
+        manifest_file = output_path / 'cache.json'
+        try:
+            with open(manifest_file, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault('entries', {})
+        manifest.setdefault('sources', {})
+        return manifest
+    
+    def _save_manifest(self, output_path: Path, manifest: Dict):
+        """
+        Atomically write the compilation cache manifest
+        """
+        manifest_file = output_path / 'cache.json'
+        tmp_file = manifest_file.with_suffix(f'.json.{os.getpid()}.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_file, manifest_file)
+    
+    def _content_key(
+        self,
+        manifest: Dict,
+        source_file: str,
+        architecture: str,
+        optimization: str,
+        static: bool = False,
+        link: bool = True
+    ) -> str:
+        """
+        Cache key for one compilation: sha256(source bytes || command)
+        
+        The source digest is reused while the file's mtime and size are
+        unchanged, so unchanged sources are not re-read.
+        
+        Returns:
+            Hex digest identifying the compilation
+        """
+        st = os.stat(source_file)
+        stamp = manifest['sources'].get(source_file)
+        if stamp and stamp[0] == st.st_mtime_ns and stamp[1] == st.st_size:
+            source_digest = stamp[2]
+        else:
+            with open(source_file, 'rb') as f:
+                source_digest = hashlib.sha256(f.read()).hexdigest()
+            manifest['sources'][source_file] = [st.st_mtime_ns, st.st_size, source_digest]
+        
+        cmd = self._compiler_command(architecture, optimization) + ['-fno-stack-protector']
+        cmd += self._link_flags(static) if link else ['-c']
+        h = hashlib.sha256(source_digest.encode())
+        h.update(b'\0' + '\0'.join(cmd).encode())
+        return h.hexdigest()
+    
+    def _restore_cached(self, manifest: Dict, content_key: str, task: Tuple) -> Optional[Dict]:
+        """
+        Hardlink (or copy) a previously built binary into place
+        
+        Returns:
+            Metadata for the restored binary, or None on a cache miss
+        """
+        library_name, func_name, source_file, output_file, arch, opt = task
+        entry = manifest['entries'].get(content_key)
+        if entry is None:
+            return None
+        
+        cached = Path(entry['binary_path'])
+        if not cached.exists():
+            del manifest['entries'][content_key]
+            return None
+        
+        if cached.resolve() != output_file.resolve():
+            try:
+                output_file.unlink()
+            except FileNotFoundError:
+                pass
+            try:
+                os.link(cached, output_file)
+            except OSError:
+                # Cross-device or unsupported filesystem
+                shutil.copy2(cached, output_file)
+        
+        return {
+            **entry,
+            'binary_path': str(output_file),
+            'source_path': str(source_file),
+            'function': func_name,
+            'library': library_name,
+        }
+    
+    @staticmethod
+    def _split_batches(sources: List[str], batch_size: int) -> List[List[str]]:
+        """
+        Chunk sources into batches with unique file stems
+        
+        Args:
+            sources: Unique source paths
+            batch_size: Maximum sources per batch
+        
+        Returns:
+            List of batches
+        """
+        batches: List[List[str]] = []
+        current: List[str] = []
+        stems = set()
+        for src in sources:
+            stem = Path(src).stem
+            if len(current) >= batch_size or stem in stems:
+                batches.append(current)
+                current, stems = [], set()
+            current.append(src)
+            stems.add(stem)
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _link_task(
+        self,
+        task: Tuple,
+        object_file: Path,
+        static: bool = False,
+        link: bool = True
+    ) -> Optional[Tuple[Tuple[str, str, str], Dict]]:
+        """
+        Link one (library, function, source, output, arch, opt) task
+        
+        Runs on a worker thread; returns the result key and metadata, or None
+        if linking failed.
+        """
+        library_name, func_name, source_file, output_file, arch, opt = task
+        
+        if link:
+            success = self.link_object(
+                object_file=object_file,
+                output_file=str(output_file),
+                architecture=arch,
+                optimization=opt,
+                static=static
+            )
+        else:
+            success = self._place_object(object_file, output_file)
+        if not success:
+            return None
+        
+        return self._binary_metadata(task)
+    
+    @staticmethod
+    def _place_object(object_file: Path, output_file: Path) -> bool:
+        """
+        Copy an unlinked object to its final output name
+        """
+        try:
+            shutil.copy2(object_file, output_file)
+            return True
+        except OSError as e:
+            logger.error(f"✗ Could not copy {object_file}: {e}")
+            return False
+    
+    def _binary_metadata(self, task: Tuple) -> Tuple[Tuple[str, str, str], Dict]:
+        """
+        Result key and metadata for a successfully built task
+        """
+        library_name, func_name, source_file, output_file, arch, opt = task
+        
+        # Store metadata
+        return (arch, opt, func_name), {
+            'binary_path': str(output_file),
+            'source_path': str(source_file),
+            'architecture': arch,
+            'optimization': opt,
+            'function': func_name,
+            'library': library_name,
+            'size': output_file.stat().st_size,
+            **self._compute_fingerprint(output_file)
+        }
+    
+    @staticmethod
+    def _index_sources(source_dir: str) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Walk the source tree once, collecting C and C++ files
+        
+        Args:
+            source_dir: Directory to search
+        
+        Returns:
+            {'.c': [(stem, path), ...], '.cpp': [...]} in walk order
+        """
+        index: Dict[str, List[Tuple[str, str]]] = {'.c': [], '.cpp': []}
+        for root, _, files in os.walk(source_dir):
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                if ext in index:
+                    index[ext].append((stem, os.path.join(root, name)))
+        return index
+    
+    def _find_source_file(
+        self,
+        source_dir: str,
+        function_name: str,
+        index: Optional[Dict[str, List[Tuple[str, str]]]] = None
+    ) -> Optional[str]:
         """
         Find source file containing a specific function
         
         Args:
             source_dir: Directory to search
             function_name: Function name to find
+            index: Prebuilt _index_sources result (scanned here if omitted)
         
         Returns:
             Path to source file or None
         """
-        source_path = Path(source_dir)
+        if index is None:
+            index = self._index_sources(source_dir)
         
-        # Common naming patterns
-        patterns = [
-            f"{function_name}.c",
-            f"{function_name}.cpp",
-            f"*{function_name}*.c",
-            f"*{function_name}*.cpp"
-        ]
-        
-        for pattern in patterns:
-            matches = list(source_path.rglob(pattern))
-            if matches:
-                return str(matches[0])
+        # Common naming patterns: exact stem first, then substring; .c before .cpp
+        for exact in (True, False):
+            for ext in ('.c', '.cpp'):
+                for stem, path in index[ext]:
+                    if stem == function_name if exact else function_name in stem:
+                        return path
         
         return None
     
-    def _compute_md5(self, file_path: Path) -> str:
+    def _compute_fingerprint(self, file_path: Path) -> Dict[str, str]:
         """
-        Compute MD5 hash of a file
+        Compute a content fingerprint of a file
+        
+        Uses BLAKE3 (mmap'd, multithreaded) if installed, then xxh3-128,
+        then hashlib's BLAKE2b.
         
         Args:
             file_path: File to hash
         
         Returns:
-            MD5 hex digest
+            Dict with 'fingerprint' (hex digest) and 'fingerprint_algo'
         """
-        md5 = hashlib.md5()
+        if blake3 is not None:
+            h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            h.update_mmap(str(file_path))
+            return {'fingerprint': h.hexdigest(), 'fingerprint_algo': 'blake3'}
+        
+        if xxhash is not None:
+            h, algo = xxhash.xxh3_128(), 'xxh3_128'
+        else:
+            h, algo = hashlib.blake2b(digest_size=16), 'blake2b-128'
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        return {'fingerprint': h.hexdigest(), 'fingerprint_algo': algo}
 
 
 class DatasetCompiler:
@@ -345,6 +1113,11 @@ class DatasetCompiler:
         
         all_results = {}
         
+        # Per-library results are journaled as they finish, so a crash
+        # mid-run keeps everything compiled so far
+        journal = self.output_dir / 'compilation_metadata.jsonl'
+        journal.unlink(missing_ok=True)
+        
         for lib_config in libraries:
             lib_name = lib_config['name']
             logger.info(f"\n{'='*60}")
@@ -370,6 +1143,7 @@ class DatasetCompiler:
             )
             
             all_results[lib_name] = results
+            self._append_journal(journal, results)
         
         # Save compilation metadata
         self._save_metadata(all_results)
@@ -435,9 +1209,56 @@ class DatasetCompiler:
                 key_str = f"{key[0]}_{key[1]}_{key[2]}"
                 serializable[lib_name][key_str] = value
         
-        with open(metadata_file, 'w') as f:
-            json.dump(serializable, f, indent=2)
+        if orjson is not None:
+            with open(metadata_file, 'wb') as f:
+                f.write(orjson.dumps(serializable, option=orjson.OPT_INDENT_2))
+        else:
+            with open(metadata_file, 'w') as f:
+                json.dump(serializable, f, indent=2)
         
         logger.info(f"Metadata saved to: {metadata_file}")
+    
+    @staticmethod
+    def _append_journal(journal: Path, results: Dict):
+        """
+        Append one JSON line per compiled binary to the metadata journal
+        
+        Args:
+            journal: Path to compilation_metadata.jsonl
+            results: compile_library results
+        """
+        lines = []
+        for key, value in results.items():
+            # Each metadata dict already carries its 'library'
+            entry = {'key': f"{key[0]}_{key[1]}_{key[2]}", **value}
+            if orjson is not None:
+                lines.append(orjson.dumps(entry))
+            else:
+                lines.append(json.dumps(entry).encode())
+        with open(journal, 'ab') as f:
+            f.write(b''.join(line + b'\n' for line in lines))
+    
+    @staticmethod
+    def load_journal(journal: str) -> Dict:
+        """
+        Rebuild compilation_metadata.json's structure from a journal
+        
+        Useful after an interrupted compile_all.
+        
+        Args:
+            journal: Path to compilation_metadata.jsonl
+        
+        Returns:
+            {library: {"arch_opt_func": metadata}}
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        merged: Dict = {}
+        with open(journal, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = loads(line)
+                merged.setdefault(entry['library'], {})[entry.pop('key')] = entry
+        return merged
 
 
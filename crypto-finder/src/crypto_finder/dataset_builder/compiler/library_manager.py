@@ -2,17 +2,30 @@
 Manages downloading and organizing crypto library source code
 """
 
+import hashlib
+import os
+import subprocess
+import threading
 import requests
 import tarfile
 import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
 from crypto_finder.common.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# Archives below this size aren't worth splitting into range requests
+SEGMENTED_MIN_SIZE = 8 << 20
+
 
 class LibraryManager:
     """
@@ -28,6 +41,9 @@ class LibraryManager:
         """
         self.sources_dir = Path(sources_dir)
         self.sources_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Shared session: repeated downloads reuse keep-alive connections
+        self.session = requests.Session()
     
     def get_library(
         self,
@@ -56,14 +72,16 @@ class LibraryManager:
         # Download if URL provided
         if url:
             logger.info(f"Downloading {name} from {url}")
-            archive_path = self._download_file(url)
+            archive_path, digest = self._download_file(url)
             
             # Extract
             logger.info(f"Extracting {name}...")
             self._extract_archive(archive_path, lib_dir.parent)
             
-            # Clean up archive
+            # Clean up archive; keep its hash so later runs can verify
+            # without re-reading it
             archive_path.unlink()
+            self._hash_file(lib_dir).write_text(f"{digest}  {url}\n")
             
             logger.info(f"✓ {name} ready at {lib_dir}")
             return str(lib_dir)
@@ -71,35 +89,163 @@ class LibraryManager:
         else:
             raise ValueError(f"Library {name} not found and no URL provided")
     
-    def _download_file(self, url: str) -> Path:
+    def get_archive_hash(self, name: str, version: Optional[str] = None) -> Optional[str]:
         """
-        Download file from URL
+        Hash of the archive a library was extracted from
+        
+        Args:
+            name: Library name
+            version: Version string
+        
+        Returns:
+            "<algo>:<hex digest>", or None if the library wasn't downloaded here
+        """
+        lib_dir = self.sources_dir / f"{name}-{version}" if version else self.sources_dir / name
+        hash_file = self._hash_file(lib_dir)
+        if not hash_file.exists():
+            return None
+        return hash_file.read_text().split()[0]
+    
+    @staticmethod
+    def _hash_file(lib_dir: Path) -> Path:
+        return lib_dir.with_name(lib_dir.name + '.hash')
+    
+    @staticmethod
+    def _new_hasher():
+        if blake3 is not None:
+            return blake3.blake3(), 'blake3'
+        return hashlib.sha256(), 'sha256'
+    
+    def _download_file(self, url: str, timeout: float = 60, segments: int = 8) -> Tuple[Path, str]:
+        """
+        Download file from URL, hashing it while it streams to disk
+        
+        Large files from servers that accept byte ranges are fetched as
+        `segments` parallel range requests instead.
         
         Args:
             url: URL to download from
+            timeout: Connect/read timeout in seconds
+            segments: Parallel connections for segmented downloads
         
         Returns:
-            Path to downloaded file
+            Path to downloaded file and its "<algo>:<hex digest>"
         """
         filename = url.split('/')[-1]
         output_path = self.sources_dir / filename
         
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        if segments > 1:
+            try:
+                head = self.session.head(url, allow_redirects=True, timeout=timeout)
+                size = int(head.headers.get('content-length', 0))
+                ranged = head.ok and head.headers.get('accept-ranges', '').lower() == 'bytes'
+            except requests.RequestException:
+                ranged, size = False, 0
+            
+            if ranged and size >= SEGMENTED_MIN_SIZE:
+                try:
+                    return self._download_segmented(head.url, output_path, size, segments, timeout)
+                except (requests.RequestException, OSError) as e:
+                    logger.warning(f"Segmented download failed ({e}), retrying as one stream")
+        
+        h, algo = self._new_hasher()
+        
+        with self.session.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            
+            # Unknown length (0) just gives a progress bar without a total
+            total_size = int(response.headers.get('content-length', 0)) or None
+            
+            from tqdm import tqdm
+            with open(output_path, 'wb') as f, \
+                    tqdm(total=total_size, unit='B', unit_scale=True) as pbar:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+                    h.update(chunk)
+                    pbar.update(len(chunk))
+        
+        return output_path, f"{algo}:{h.hexdigest()}"
+    
+    def _download_segmented(
+        self,
+        url: str,
+        output_path: Path,
+        size: int,
+        segments: int,
+        timeout: float
+    ) -> Tuple[Path, str]:
+        """
+        Fetch a file as parallel `Range:` requests written with os.pwrite
+        
+        The first segment is hashed as it streams. Later segments land out
+        of order; each is folded into the hash once every segment before it
+        is done, read back with os.pread while it is still in the page
+        cache, so the file is never re-read in a separate pass.
+        
+        Args:
+            url: URL to download from (after redirects)
+            output_path: Where to write the file
+            size: Content-Length reported by the server
+            segments: Number of parallel range requests
+            timeout: Connect/read timeout in seconds
+        
+        Returns:
+            Path to downloaded file and its "<algo>:<hex digest>"
+        """
+        step = -(-size // segments)
+        bounds = [(lo, min(lo + step, size) - 1) for lo in range(0, size, step)]
         
-        total_size = int(response.headers.get('content-length', 0))
+        h, algo = self._new_hasher()
+        finished = [False] * len(bounds)
+        hashed = 0  # segments folded into h so far
+        lock = threading.Lock()
         
-        with open(output_path, 'wb') as f:
-            if total_size == 0:
-                f.write(response.content)
-            else:
-                from tqdm import tqdm
-                with tqdm(total=total_size, unit='B', unit_scale=True) as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        pbar.update(len(chunk))
+        from tqdm import tqdm
+        fd = os.open(output_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            
+            def advance():
+                # Caller holds lock: hash every finished segment in file order
+                nonlocal hashed
+                while hashed < len(bounds) and finished[hashed]:
+                    lo, hi = bounds[hashed]
+                    if hashed:  # segment 0 was hashed while streaming
+                        for off in range(lo, hi + 1, 1 << 20):
+                            h.update(os.pread(fd, min(1 << 20, hi + 1 - off), off))
+                    hashed += 1
+            
+            with tqdm(total=size, unit='B', unit_scale=True) as pbar:
+                def fetch(index: int, lo: int, hi: int):
+                    headers = {'Range': f'bytes={lo}-{hi}'}
+                    with self.session.get(url, headers=headers, stream=True, timeout=timeout) as r:
+                        r.raise_for_status()
+                        if r.status_code != 206:
+                            raise requests.RequestException(f"Range not honoured (HTTP {r.status_code})")
+                        offset = lo
+                        for chunk in r.iter_content(chunk_size=1 << 16):
+                            if offset + len(chunk) > hi + 1:
+                                raise requests.RequestException(f"Range {lo}-{hi} overran")
+                            os.pwrite(fd, chunk, offset)
+                            if index == 0:
+                                # Nothing else touches h until segment 0 is done
+                                h.update(chunk)
+                            offset += len(chunk)
+                            pbar.update(len(chunk))
+                    if offset != hi + 1:
+                        raise requests.RequestException(f"Short range {lo}-{hi}: got {offset - lo} bytes")
+                    with lock:
+                        finished[index] = True
+                        advance()
+                
+                with ThreadPoolExecutor(max_workers=len(bounds)) as ex:
+                    futures = [ex.submit(fetch, i, lo, hi) for i, (lo, hi) in enumerate(bounds)]
+                    for future in futures:
+                        future.result()
+        finally:
+            os.close(fd)
         
-        return output_path
+        return output_path, f"{algo}:{h.hexdigest()}"
     
     def _extract_archive(self, archive_path: Path, extract_to: Path):
         """
@@ -112,6 +258,8 @@ class LibraryManager:
         extract_to.mkdir(parents=True, exist_ok=True)
         
         if archive_path.suffix == '.gz' or archive_path.suffixes == ['.tar', '.gz']:
+            if self._extract_with_pigz(archive_path, extract_to):
+                return
             with tarfile.open(archive_path, 'r:gz') as tar:
                 tar.extractall(extract_to)
         
@@ -121,5 +269,31 @@ class LibraryManager:
         
         else:
             raise ValueError(f"Unsupported archive format: {archive_path.suffix}")
-
-
+    
+    @staticmethod
+    def _extract_with_pigz(archive_path: Path, extract_to: Path) -> bool:
+        """
+        Extract a .tar.gz through system tar with pigz decompressing
+        
+        pigz splits inflate, CRC and I/O across threads; stdlib tarfile does
+        everything on one core.
+        
+        Args:
+            archive_path: Path to archive
+            extract_to: Where to extract
+        
+        Returns:
+            True if extraction succeeded, False to fall back to tarfile
+        """
+        if not (shutil.which('tar') and shutil.which('pigz')):
+            return False
+        
+        result = subprocess.run(
+            ['tar', '--use-compress-program=pigz', '-xf', str(archive_path), '-C', str(extract_to)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            logger.warning(f"tar/pigz extraction failed, using tarfile: {result.stderr.strip()}")
+            return False
+        return True
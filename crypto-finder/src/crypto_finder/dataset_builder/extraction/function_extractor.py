@@ -7,15 +7,39 @@ Uses multiple tools to ensure comprehensive extraction:
 - CFG-based reconstruction
 """
 
+import mmap
+import os
+import re
 import subprocess
 import shutil
-from pathlib import Path
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional
 
-from crypto_finder.common.logging import setup_logging
+try:
+    from elftools.elf.elffile import ELFFile
+    from elftools.elf.sections import SymbolTableSection
+except ImportError:
+    ELFFile = None
+
+from crypto_finder.common.logging import setup_logging, worker_logging
 
 logger = setup_logging(__name__)
 
+# Common function prologues, one alternation so a single pass covers all archs
+PROLOGUE_PATTERN = re.compile(
+    rb'\x55\x89\xe5'                  # x86: push ebp; mov ebp, esp
+    rb'|\x55\x48\x89\xe5'             # x86-64: push rbp; mov rbp, rsp
+    rb'|\x00\x48\x2d\xe9'             # ARM: push {r11, lr}
+    rb'|\xfd\x7b[\x80-\xbf]\xa9'       # AArch64: stp x29, x30, [sp, #-N]!
+)
+
+# `readelf -sW` FUNC rows: "Num: Value Size Type Bind Vis Ndx Name".
+# Ndx UND rows are imports with no body in this binary.
+READELF_FUNC_PATTERN = re.compile(
+    r'\s*\d+:\s+([0-9a-fA-F]+)\s+(0x[0-9a-fA-F]+|\d+)\s+FUNC\s+\S+\s+\S+\s+(?!UND\s)\S+\s+(\S+)'
+)
+
 
 class FunctionExtractor:
     """
@@ -53,51 +77,87 @@ class FunctionExtractor:
         
         return functions
     
+    def extract_all_batch(
+        self,
+        binary_paths: List[str],
+        max_workers: Optional[int] = None,
+        chunksize: int = 16
+    ) -> Dict[str, List[Dict]]:
+        """
+        Extract functions from many binaries on a process pool
+        
+        Args:
+            binary_paths: Paths to ELF binaries
+            max_workers: Worker processes (default: os.cpu_count())
+            chunksize: Binaries handed to a worker per round trip
+        
+        Returns:
+            Dictionary mapping each binary path to its extract_all result
+        """
+        if len(binary_paths) <= 1:
+            return {path: self.extract_all(path) for path in binary_paths}
+        
+        # The extractor only holds two booleans, so it pickles cheaply
+        with worker_logging() as (init, init_args), \
+                ProcessPoolExecutor(max_workers=max_workers, initializer=init, initargs=init_args) as ex:
+            results = ex.map(self.extract_all, binary_paths, chunksize=chunksize)
+            return dict(zip(binary_paths, results))
+    
     def _extract_from_symbols(self, binary_path: str) -> List[Dict]:
         """
         Extract functions using symbol table
         
+        Reads .symtab/.dynsym in-process with pyelftools when installed,
+        otherwise parses `readelf -sW` output.
+        
         Args:
             binary_path: Path to binary
         
         Returns:
             List of functions with metadata
         """
+        if ELFFile is not None:
+            try:
+                return self._extract_with_pyelftools(binary_path)
+            except Exception as e:
+                logger.error(f"Symbol extraction failed: {e}")
+                return []
+        
         if not self.readelf_available:
             return []
         
         try:
-            result = subprocess.run(
-                ['readelf', '-s', binary_path],
-                capture_output=True,
-                text=True,
-                timeout=30
+            # -W: don't truncate long symbol names. Output is parsed line by
+            # line as readelf writes it instead of being buffered whole.
+            proc = subprocess.Popen(
+                ['readelf', '-sW', binary_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
-            
-            if result.returncode != 0:
-                return []
+            # Watchdog: kill readelf if it runs past the timeout
+            watchdog = threading.Timer(30, proc.kill)
+            watchdog.start()
             
             functions: List[Dict] = []
-            
-            # Parse readelf output
-            for line in result.stdout.split('\n'):
-                # Look for FUNC entries
-                if 'FUNC' in line:
-                    parts = line.split()
-                    if len(parts) >= 8:
-                        try:
-                            address = int(parts[1], 16)
-                            size = int(parts[2])
-                            name = parts[7]
-                            
+            try:
+                with proc.stdout:
+                    for line in proc.stdout:
+                        m = READELF_FUNC_PATTERN.match(line)
+                        if m:
+                            address, size, name = m.groups()
                             functions.append({
-                                'address': address,
-                                'size': size,
+                                'address': int(address, 16),
+                                'size': int(size, 0),
                                 'name': name,
                                 'source': 'symbol'
                             })
-                        except (ValueError, IndexError):
-                            continue
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+            
+            if returncode != 0:
+                return []
             
             return functions
         
@@ -105,13 +165,44 @@ class FunctionExtractor:
             logger.error(f"Symbol extraction failed: {e}")
             return []
     
+    def _extract_with_pyelftools(self, binary_path: str) -> List[Dict]:
+        """
+        Read FUNC symbols from every symbol table section with pyelftools
+        
+        Args:
+            binary_path: Path to binary
+        
+        Returns:
+            List of functions with metadata
+        """
+        functions: List[Dict] = []
+        with open(binary_path, 'rb') as f:
+            elf = ELFFile(f)
+            for section in elf.iter_sections():
+                if not isinstance(section, SymbolTableSection):
+                    continue
+                for sym in section.iter_symbols():
+                    # Imports (SHN_UNDEF) have no body here; counting them
+                    # would keep stripped binaries off the heuristic path
+                    if sym['st_info']['type'] != 'STT_FUNC' or sym['st_shndx'] == 'SHN_UNDEF':
+                        continue
+                    functions.append({
+                        'address': sym['st_value'],
+                        'size': sym['st_size'],
+                        'name': sym.name,
+                        'source': 'symbol'
+                    })
+        return functions
+    
     def _extract_heuristic(self, binary_path: str) -> List[Dict]:
         """
         Extract functions using heuristics (for stripped binaries)
         
-        Looks for common function prologue patterns:
+        Looks for common function prologue patterns (see PROLOGUE_PATTERN):
         - x86: push ebp; mov ebp, esp
+        - x86-64: push rbp; mov rbp, rsp
         - ARM: push {r11, lr}
+        - AArch64: stp x29, x30, [sp, #-N]!
         
         Args:
             binary_path: Path to binary
@@ -119,32 +210,23 @@ class FunctionExtractor:
         Returns:
             List of detected functions
         """
-        functions: List[Dict] = []
-        
         try:
-            # Read binary
-            data = Path(binary_path).read_bytes()
-            
-            # Simple pattern matching for x86 function prologues
-            # Pattern: 55 89 e5 (push ebp; mov ebp, esp)
-            prologue_pattern = b'\x55\x89\xe5'
-            
-            offset = 0
-            while True:
-                offset = data.find(prologue_pattern, offset)
-                if offset == -1:
-                    break
-                
-                functions.append({
-                    'address': offset,
-                    'size': 0,  # Unknown without further analysis
-                    'name': f'sub_{offset:x}',
-                    'source': 'heuristic'
-                })
-                
-                offset += 1
-            
-            return functions
+            # Map the binary read-only; pages are faulted in as the scan reaches them
+            with open(binary_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return [
+                        {
+                            'address': m.start(),
+                            'size': 0,  # Unknown without further analysis
+                            'name': f'sub_{m.start():x}',
+                            'source': 'heuristic'
+                        }
+                        for m in PROLOGUE_PATTERN.finditer(mm)
+                    ]
         
         except Exception as e:
             logger.error(f"Heuristic extraction failed: {e}")
@@ -10,6 +10,9 @@ Assigns labels to extracted functions based on:
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
+import re
+
+import pandas as pd
 
 from crypto_finder.common.logging import setup_logging
 
@@ -60,6 +63,12 @@ class AutoLabeler:
         'scrypt': 'Scrypt',
     }
     
+    # All keys in one alternation; longest first so 'ecdsa' wins over 'dsa'
+    # and '3des' over 'des' at the same position
+    _PATTERN = re.compile('|'.join(
+        re.escape(k) for k in sorted(ALGORITHM_MAP, key=len, reverse=True)
+    ))
+    
     def __init__(self, compilation_metadata: Optional[str] = None):
         """
         Initialize auto-labeler
@@ -88,6 +97,19 @@ class AutoLabeler:
         Returns:
             Function info with added 'label' field
         """
+        function_info['label'] = self._label_for_binary(binary_path)
+        return function_info
+    
+    def _label_for_binary(self, binary_path: str) -> Dict:
+        """
+        Build the label implied by a binary's filename
+        
+        Args:
+            binary_path: Path to binary
+        
+        Returns:
+            Label dict
+        """
         # Extract metadata from binary filename
         # Format: library_function_arch_opt.bin
         binary_name = Path(binary_path).stem
@@ -102,7 +124,7 @@ class AutoLabeler:
             # Determine algorithm
             algorithm = self._detect_algorithm(func_name)
             
-            function_info['label'] = {
+            return {
                 'algorithm': algorithm,
                 'library': library,
                 'architecture': architecture,
@@ -110,14 +132,12 @@ class AutoLabeler:
                 'function_name': func_name,
                 'is_crypto': True
             }
-        else:
-            # Unknown format
-            function_info['label'] = {
-                'algorithm': 'Unknown',
-                'is_crypto': False
-            }
         
-        return function_info
+        # Unknown format
+        return {
+            'algorithm': 'Unknown',
+            'is_crypto': False
+        }
     
     def _detect_algorithm(self, function_name: str) -> str:
         """
@@ -129,13 +149,8 @@ class AutoLabeler:
         Returns:
             Algorithm name or 'Unknown'
         """
-        func_lower = function_name.lower()
-        
-        for key, value in self.ALGORITHM_MAP.items():
-            if key in func_lower:
-                return value
-        
-        return 'Unknown'
+        m = self._PATTERN.search(function_name.lower())
+        return self.ALGORITHM_MAP[m.group(0)] if m else 'Unknown'
     
     def label_batch(
         self,
@@ -152,6 +167,45 @@ class AutoLabeler:
         Returns:
             Labeled functions
         """
-        return [self.label_function(binary_path, func.copy()) for func in functions]
+        # Every function in the binary gets the same label; derive it once
+        label = self._label_for_binary(binary_path)
+        return [{**func, 'label': dict(label)} for func in functions]
+    
+    def label_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Label a table of functions with vectorized string ops
+        
+        Same rules as label_function, but the label fields become flat
+        columns (algorithm, library, architecture, optimization,
+        function_name, is_crypto) instead of a nested 'label' dict.
+        
+        Args:
+            df: DataFrame with a 'binary_path' column, one row per function
+        
+        Returns:
+            Copy of df with the label columns added
+        """
+        paths = df['binary_path']
+        # Few distinct binaries, many functions: parse each path once
+        stems = paths.map({p: Path(p).stem for p in paths.unique()}).astype(object)
+        # object dtype: columns reindex adds (short names, empty df) are
+        # all-NaN floats otherwise, and .str would reject them
+        parts = stems.str.split('_', expand=True).reindex(columns=range(4)).astype(object)
+        valid = parts[3].notna()
+        
+        algorithm = (
+            parts[1].str.lower()
+            .str.extract(f'({self._PATTERN.pattern})', expand=False)
+            .map(self.ALGORITHM_MAP)
+        )
+        
+        out = df.copy()
+        out['algorithm'] = algorithm.where(valid).fillna('Unknown')
+        out['library'] = parts[0].where(valid)
+        out['architecture'] = parts[2].where(valid)
+        out['optimization'] = parts[3].where(valid)
+        out['function_name'] = parts[1].where(valid)
+        out['is_crypto'] = valid
+        return out
 
 
@@ -1,7 +1,6 @@
 # Hinglish: Dynamic runner ke liye command-line tool.
 
 import typer
-from crypto_finder.dynamic_runner.core import DynamicRunner
 from crypto_finder.common.logging import log
 import json
 
@@ -24,6 +23,7 @@ def dynamic_run(
         typer.secho("❌ Error: Invalid hexadecimal string in --shellcode.", fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
+    from crypto_finder.dynamic_runner.core import DynamicRunner
     runner = DynamicRunner()
     result = runner.emulate(code=code_bytes)
 
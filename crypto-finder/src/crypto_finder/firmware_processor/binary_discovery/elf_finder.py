@@ -4,46 +4,117 @@ ELF binary discovery within extracted firmware trees
 
 import os
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional, Tuple
 
 from crypto_finder.common.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+ELF_MAGIC = b"\x7fELF"
+_EXEC_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+# O_NOATIME skips the atime write-back; only allowed on files we own
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+
+def _read_magic(path: str) -> bytes:
+    try:
+        fd = os.open(path, os.O_RDONLY | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.pread(fd, 4, 0)
+    finally:
+        os.close(fd)
+
 
 def _is_elf(file_path: Path) -> bool:
     try:
-        with open(file_path, 'rb') as f:
-            magic = f.read(4)
-            return magic == b"\x7fELF"
+        return _read_magic(str(file_path)) == ELF_MAGIC
     except Exception:
         return False
 
 
+def _check_entry(entry: os.DirEntry) -> Optional[Tuple[str, int, bool]]:
+    """
+    (path, size, executable) if entry is an ELF regular file, else None
+    """
+    try:
+        if not entry.is_file(follow_symlinks=False):
+            return None
+        st = entry.stat(follow_symlinks=False)
+        if st.st_size < 4 or _read_magic(entry.path) != ELF_MAGIC:
+            return None
+        return entry.path, st.st_size, bool(st.st_mode & _EXEC_BITS)
+    except OSError:
+        return None
+
+
+def _scan_tree(root: str) -> Iterator[Tuple[str, int, bool]]:
+    """
+    Yield (path, size, executable) for every ELF regular file under root
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                hit = _check_entry(entry)
+                if hit is not None:
+                    yield hit
+
+
+def _scan_subtree(root: str) -> List[Tuple[str, int, bool]]:
+    return list(_scan_tree(root))
+
+
 class ElfFinder:
     """
     Recursively find ELF binaries under a directory
     """
 
-    def __init__(self, root_dir: str):
+    def __init__(self, root_dir: str, max_workers: Optional[int] = None):
         self.root = Path(root_dir)
+        # Discovery is syscall-bound; threads overlap the blocking I/O
+        self.max_workers = max_workers or min(32, 4 * (os.cpu_count() or 1))
 
     def find_all(self) -> List[Dict]:
-        results: List[Dict] = []
-        for dirpath, _, filenames in os.walk(self.root):
-            for name in filenames:
-                p = Path(dirpath) / name
-                try:
-                    if _is_elf(p):
-                        st = p.stat()
-                        is_executable = bool(st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
-                        results.append({
-                            'path': str(p),
-                            'size': st.st_size,
-                            'executable': is_executable,
-                        })
-                except Exception:
-                    continue
+        found: List[Tuple[str, int, bool]] = []
+        subtrees: List[str] = []
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subtrees.append(entry.path)
+                        continue
+                    # Files directly under root are checked inline
+                    hit = _check_entry(entry)
+                    if hit is not None:
+                        found.append(hit)
+        except OSError as e:
+            logger.warning(f"Cannot scan {self.root}: {e}")
+
+        # One work item per top-level directory
+        if subtrees:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(subtrees))) as ex:
+                for sub in ex.map(_scan_subtree, subtrees):
+                    found.extend(sub)
+
+        results = [
+            {'path': path, 'size': size, 'executable': executable}
+            for path, size, executable in found
+        ]
         logger.info(f"Discovered {len(results)} ELF binaries under {self.root}")
         return results
@@ -2,17 +2,22 @@
 Basic triage utilities for extracted firmware content
 """
 
-from pathlib import Path
+import heapq
+import os
+from operator import methodcaller
 from typing import Dict, List
 
 
 def group_by_directory(binaries: List[Dict]) -> Dict[str, List[Dict]]:
     groups: Dict[str, List[Dict]] = {}
+    # Plain string split instead of building a Path per binary
+    dirname = os.path.dirname
     for b in binaries:
-        parent = str(Path(b['path']).parent)
+        parent = dirname(b['path']) or '.'
         groups.setdefault(parent, []).append(b)
     return groups
 
 
 def top_n_largest(binaries: List[Dict], n: int = 50) -> List[Dict]:
-    return sorted(binaries, key=lambda x: x.get('size', 0), reverse=True)[:n]
+    # O(N log n) partial selection; methodcaller keeps the size lookup in C
+    return heapq.nlargest(n, binaries, key=methodcaller('get', 'size', 0))
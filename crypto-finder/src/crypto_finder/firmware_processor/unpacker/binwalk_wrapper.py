@@ -4,18 +4,48 @@ Firmware unpacking using binwalk
 Extracts filesystem and binaries from firmware images
 """
 
+import os
 import subprocess
 import shutil
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Optional, List
 import tempfile
 
 from crypto_finder.common.logging import setup_logging
 from crypto_finder.common.exceptions import FirmwareExtractionError
+from crypto_finder.firmware_processor.unpacker.fs_extractors import dispatch
 
 logger = setup_logging(__name__)
 
 
+def _find_extracted(root: Path) -> Optional[Path]:
+    """
+    Shallowest binwalk output directory under root, or None
+
+    Breadth-first, stopping at the first hit: nested matryoshka levels live
+    inside the outermost directory, so the rest of the tree is never listed.
+    """
+    queue = deque([str(root)])
+    while queue:
+        try:
+            it = os.scandir(queue.popleft())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                if entry.name.endswith(('.extracted', '_extracted')):
+                    return Path(entry.path)
+                queue.append(entry.path)
+    return None
+
+
 class FirmwareUnpacker:
     """
     Unpacks firmware images using binwalk
@@ -56,28 +86,68 @@ class FirmwareUnpacker:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
         
-        # Run binwalk extraction
+        # Run binwalk extraction; matryoshka mode (-M) recurses into
+        # whatever it carves, up to 5 levels deep
         cmd = [
-            'binwalk', '-e', '--dd=.*,"firmware.bin"',
+            'binwalk', '-Me', '-d', '5',
             '-C', str(output_path),
             str(self.firmware_path)
         ]
         logger.info(f"Running binwalk: {' '.join(cmd)}")
         
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
-            if result.returncode != 0:
-                logger.error(result.stderr)
-                raise FirmwareExtractionError("Binwalk extraction failed")
-        except subprocess.TimeoutExpired:
-            raise FirmwareExtractionError("Binwalk extraction timed out")
+        self._run_streamed(cmd, timeout=1800)
         
         # Locate likely extraction directory created by binwalk
-        extracted_candidates: List[Path] = list(output_path.glob("**/*_extracted"))
-        if not extracted_candidates:
-            # Fallback: if binwalk created files directly
-            extracted_candidates = [output_path]
+        # Fallback: if binwalk created files directly
+        self.extracted_dir = _find_extracted(output_path) or output_path
         
-        self.extracted_dir = extracted_candidates[0]
+        # Filesystems binwalk carved but couldn't unpack
+        dispatch(self.extracted_dir, self.firmware_path.stat().st_size)
         logger.info(f"Firmware extracted to: {self.extracted_dir}")
         return str(self.extracted_dir)
+    
+    @staticmethod
+    def _run_streamed(cmd: List[str], timeout: float):
+        """
+        Run a command, logging its output line by line as it is produced
+        
+        Only the last lines are kept (for the error message), so memory
+        stays flat however much binwalk prints.
+        
+        Args:
+            cmd: Command to run
+            timeout: Seconds before the process is killed
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors='replace',
+            bufsize=1
+        )
+        timed_out = threading.Event()
+        
+        def expire():
+            timed_out.set()
+            proc.kill()
+        
+        # Watchdog: kill binwalk if it runs past the timeout
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.start()
+        tail: deque = deque(maxlen=50)
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    logger.debug(line)
+                    tail.append(line)
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+        
+        if timed_out.is_set():
+            raise FirmwareExtractionError("Binwalk extraction timed out")
+        if returncode != 0:
+            logger.error("\n".join(tail))
+            raise FirmwareExtractionError("Binwalk extraction failed")
@@ -0,0 +1,211 @@
+"""
+Recursive filesystem extraction after binwalk
+
+binwalk misses or fails on some nested filesystems (SquashFS inside UBI,
+JFFS2 images, cpio initramfs). This pass looks for filesystem magic at the
+start of each extracted file and hands it to the matching native tool.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from crypto_finder.common.logging import setup_logging
+
+logger = setup_logging(__name__)
+
+# Leading bytes -> extractor name
+FS_MAGICS: Dict[bytes, str] = {
+    b'hsqs': 'squashfs',
+    b'sqsh': 'squashfs',
+    b'UBI#': 'ubi',
+    # JFFS2 node magic 0x1985 + node type (cleanmarker/dirent/inode), LE and BE
+    b'\x85\x19\x03\x20': 'jffs2',
+    b'\x19\x85\x20\x03': 'jffs2',
+    b'\x85\x19\x01\xe0': 'jffs2',
+    b'\x19\x85\xe0\x01': 'jffs2',
+    b'\x85\x19\x02\xe0': 'jffs2',
+    b'\x19\x85\xe0\x02': 'jffs2',
+    b'7z\xbc\xaf\x27\x1c': '7z',
+    b'070701': 'cpio',
+    b'070702': 'cpio',
+    b'070707': 'cpio',
+}
+
+# Extractor name -> (tool, argv builder(src, dest))
+EXTRACTORS: Dict[str, Tuple[str, Callable[[str, str], List[str]]]] = {
+    'squashfs': ('unsquashfs', lambda src, dest: ['unsquashfs', '-no-progress', '-f', '-d', dest, src]),
+    'ubi': ('ubireader_extract_files', lambda src, dest: ['ubireader_extract_files', '-o', dest, src]),
+    'jffs2': ('jefferson', lambda src, dest: ['jefferson', '-f', '-d', dest, src]),
+    '7z': ('7z', lambda src, dest: ['7z', 'x', '-y', f'-o{dest}', src]),
+    'cpio': ('cpio', lambda src, dest: ['cpio', '-idm', '--no-absolute-filenames', '-F', src]),
+}
+
+_HEAD = 16
+
+# Directories binwalk -Me leaves next to a carved image it unpacked itself
+# (squashfs-root, squashfs-root-0, ...); `_<name>.extracted` covers the rest
+BINWALK_ROOTS: Dict[str, str] = {
+    'squashfs': 'squashfs-root',
+    'jffs2': 'jffs2-root',
+    'ubi': 'ubifs-root',
+    'cpio': 'cpio-root',
+}
+
+
+def _identify(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(_HEAD)
+    except OSError:
+        return None
+    for magic, name in FS_MAGICS.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _tree_size(root: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _unpacked_by_binwalk(name: str, kind: str, dirnames: List[str]) -> bool:
+    if f"_{name}.extracted" in dirnames:
+        return True
+    prefix = BINWALK_ROOTS.get(kind)
+    return prefix is not None and any(
+        d == prefix or d.startswith(prefix + '-') for d in dirnames
+    )
+
+
+def _candidates(root: Path) -> List[Tuple[str, str]]:
+    """
+    (path, extractor name) for every regular file under root with FS magic
+
+    Images binwalk already unpacked in place are skipped; extracting them
+    again would report every binary inside twice.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path) or not os.path.isfile(path):
+                continue
+            kind = _identify(path)
+            if kind is None:
+                continue
+            if _unpacked_by_binwalk(name, kind, dirnames):
+                logger.debug(f"{path} already unpacked by binwalk; skipping")
+                continue
+            found.append((path, kind))
+    return found
+
+
+def _extract(path: str, kind: str, timeout: float) -> Optional[Path]:
+    """
+    Run the extractor for one image; the output directory, or None on failure
+    """
+    tool, argv = EXTRACTORS[kind]
+    if not shutil.which(tool):
+        logger.debug(f"{tool} not installed; skipping {kind} image {path}")
+        return None
+    # Absolute paths: the tool runs with dest as its working directory
+    src = Path(path).resolve()
+    dest = src.with_name(f"_{src.name}.fs")
+    dest.mkdir(exist_ok=True)
+    try:
+        # cpio extracts into its working directory; the others take -d/-o
+        result = subprocess.run(
+            argv(str(src), str(dest)),
+            cwd=dest,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace',
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning(f"{tool} timed out on {path}")
+        shutil.rmtree(dest, ignore_errors=True)
+        return None
+    if result.returncode != 0:
+        logger.warning(f"{tool} failed on {path}: {result.stderr.strip()[-500:]}")
+        shutil.rmtree(dest, ignore_errors=True)
+        return None
+    return dest
+
+
+def dispatch(
+    root: Path,
+    original_size: int,
+    max_depth: int = 3,
+    timeout: float = 300,
+    size_factor: int = 8
+) -> List[Path]:
+    """
+    Extract nested filesystem images under root until nothing new turns up
+
+    Each round only scans directories created by the previous one. Images
+    with identical content are extracted once.
+
+    Args:
+        root: binwalk output directory
+        original_size: Size of the firmware image in bytes
+        max_depth: Maximum extraction rounds
+        timeout: Per-extractor timeout in seconds
+        size_factor: Stop once extracted data exceeds this multiple of original_size
+
+    Returns:
+        Directories created by the extractors
+    """
+    budget = size_factor * max(original_size, 1)
+    seen: Set[str] = set()
+    created: List[Path] = []
+    used = 0
+    frontier = [Path(root)]
+
+    for depth in range(max_depth):
+        next_frontier: List[Path] = []
+        for scan_root in frontier:
+            for path, kind in _candidates(scan_root):
+                if used >= budget:
+                    logger.warning(f"Extraction size cap ({budget} bytes) reached; stopping")
+                    return created
+                try:
+                    digest = _sha256(path)
+                except OSError:
+                    continue
+                if digest in seen:
+                    continue
+                seen.add(digest)
+
+                dest = _extract(path, kind, timeout)
+                if dest is None:
+                    continue
+                used += _tree_size(dest)
+                created.append(dest)
+                next_frontier.append(dest)
+                logger.info(f"Extracted {kind} image {path} (depth {depth + 1})")
+        if not next_frontier:
+            break
+        frontier = next_frontier
+
+    return created
@@ -1,39 +1,117 @@
 """
 Angr adapter for lifting/analyzing binaries (stubbed if angr not installed)
+
+An AngrAdapter should live for the whole run: it builds each binary's CFG
+once and answers every later per-function query from it. Projects and
+CFGs run to hundreds of MB, so only the `max_projects` most recently used
+binaries are kept.
 """
 
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from crypto_finder.common.cache import file_cache
 from crypto_finder.common.logging import log
 
 
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _function_info(f: Any) -> Dict:
+    return {
+        'name': f.name,
+        'address': f.addr,
+        'size': getattr(f, 'size', 0) or 0,
+    }
+
+
 class AngrAdapter:
-    def __init__(self):
+    def __init__(self, max_projects: int = 4):
         try:
             import angr  # noqa: F401
             self.available = True
         except Exception:
             self.available = False
+        # path -> (project, CFGFast result), built on first use, LRU order
+        self.max_projects = max(1, max_projects)
+        self._cache: "OrderedDict[Path, Tuple[Any, Any]]" = OrderedDict()
+        # Function listings persist across runs, keyed by path + content
+        # digest so rebuilt binaries miss. Failures raise and aren't cached.
+        self._listing = file_cache("angr_functions")(self._list_uncached)
+
+    def _get_cfg(self, binary_path: Path) -> Tuple[Any, Any]:
+        path = Path(binary_path)
+        if path in self._cache:
+            self._cache.move_to_end(path)
+            return self._cache[path]
+        import angr
+        proj = angr.Project(str(path), auto_load_libs=False)
+        entry = (proj, proj.analyses.CFGFast(normalize=True))
+        self._cache[path] = entry
+        while len(self._cache) > self.max_projects:
+            self._cache.popitem(last=False)
+        return entry
+
+    def evict(self, binary_path: Path) -> None:
+        """
+        Drop the project and CFG held for a binary once it is done with
+        """
+        self._cache.pop(Path(binary_path), None)
+
+    def _list_uncached(self, path_str: str, digest: str) -> List[Dict]:
+        _, cfg = self._get_cfg(Path(path_str))
+        return [_function_info(f) for f in cfg.kb.functions.values()]
 
     def list_functions(self, binary_path: Path) -> List[Dict]:
         if not self.available:
             log.warning("angr not available; returning empty function list")
             return []
         try:
-            import angr
-            proj = angr.Project(str(binary_path), auto_load_libs=False)
-            cfg = proj.analyses.CFGFast()
-            funcs = []
-            for f in cfg.kb.functions.values():
-                funcs.append({
-                    'name': f.name,
-                    'address': f.addr,
-                    'size': getattr(f, 'size', 0) or 0,
-                })
-            return funcs
+            path = Path(binary_path)
+            if path in self._cache:
+                return self._list_uncached(str(path), "")
+            return self._listing(str(path), _file_digest(path))
         except Exception as e:
             log.error(f"angr analysis failed: {e}")
             return []
 
+    def get_function(self, binary_path: Path, addr: int) -> Optional[Dict]:
+        """
+        Name, address and size of the function at `addr`, or None
+        """
+        if not self.available:
+            return None
+        try:
+            _, cfg = self._get_cfg(binary_path)
+            if addr not in cfg.kb.functions:
+                return None
+            return _function_info(cfg.kb.functions[addr])
+        except Exception as e:
+            log.error(f"angr analysis failed: {e}")
+            return None
 
+    def iter_blocks(self, binary_path: Path, addr: int) -> Iterator[Dict]:
+        """
+        Yield address and size of each basic block in the function at `addr`
+        """
+        if not self.available:
+            return
+        try:
+            _, cfg = self._get_cfg(binary_path)
+            if addr not in cfg.kb.functions:
+                return
+            # Local view of transition_graph: the function's own blocks only,
+            # without call targets and return sites
+            graph = cfg.kb.functions[addr].graph
+        except Exception as e:
+            log.error(f"angr analysis failed: {e}")
+            return
+        for node in sorted(graph.nodes(), key=lambda n: n.addr):
+            yield {'address': node.addr, 'size': node.size}
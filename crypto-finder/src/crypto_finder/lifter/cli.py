@@ -3,7 +3,6 @@
 
 import typer
 from pathlib import Path
-from crypto_finder.lifter.core import Lifter
 from crypto_finder.common.logging import log
 import os
 
@@ -37,6 +36,7 @@ def lift(
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    from crypto_finder.lifter.core import Lifter
     lifter = Lifter()
     result_path = lifter.process_binary(binary_path, output_dir)
     
@@ -7,17 +7,60 @@ Usage:
     crypto-finder train --model-type rf
 """
 
-import argparse
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import List
 
-from crypto_finder.common.logging import setup_logging
+import typer
+
+from crypto_finder.common.logging import log, setup_logging, worker_logging
 from crypto_finder.common.config import load_config
 
+# Lifter, Static Scanner, Symbolic, aur Dynamic se unke CLI functions ko import karo.
+from crypto_finder.lifter.cli import lift
+from crypto_finder.static_scanner.cli import scan
+from crypto_finder.symbolic.cli import analyze_loops
+from crypto_finder.dynamic_runner.cli import dynamic_run
+
 logger = setup_logging(__name__)
 
 
+class ModelType(str, Enum):
+    rf = "rf"
+    gb = "gb"
+    neural = "neural"
+
+
+_LIFTER = None
+
+
+def _lift_one(binary_path: str, output_dir: str) -> List[dict]:
+    """
+    Extract functions from one binary (runs in a worker process)
+    """
+    global _LIFTER
+    if _LIFTER is None:
+        try:
+            # Prefer FunctionLifter if available, otherwise fallback to existing Lifter API
+            from crypto_finder.lifter.core import FunctionLifter  # type: ignore
+        except Exception:
+            from crypto_finder.lifter.core import Lifter as FunctionLifter  # type: ignore
+        _LIFTER = FunctionLifter()
+
+    extract = getattr(_LIFTER, "extract_functions", None)
+    if extract is not None:
+        return list(extract(binary_path))
+    # Fallback to a generic process method if present
+    process_method = getattr(_LIFTER, "process_binary", None)
+    if process_method is None:
+        raise AttributeError("Function extraction API not available in lifter.")
+    result = process_method(Path(binary_path), Path(output_dir))
+    if result is None:
+        return []
+    return [{"binary": binary_path, "artifact": str(result)}]
+
+
 def analyze_firmware(firmware_path: str, output_dir: str, config: dict):
     """
     Analyze a firmware binary for cryptographic functions
@@ -50,27 +93,16 @@ def analyze_firmware(firmware_path: str, output_dir: str, config: dict):
     
     # Step 3: Extract functions
     logger.info("Step 3/5: Extracting functions...")
-    try:
-        # Prefer FunctionLifter if available, otherwise fallback to existing Lifter API
-        from crypto_finder.lifter.core import FunctionLifter  # type: ignore
-    except Exception:
-        from crypto_finder.lifter.core import Lifter as FunctionLifter  # type: ignore
-    lifter = FunctionLifter()
+    # Lifting is CPU-bound and independent per binary; each worker process
+    # builds its own lifter (angr projects don't pickle)
+    binary_paths = [b["path"] if isinstance(b, dict) else b for b in binaries]
+    max_workers = config.get("max_workers") if isinstance(config, dict) else None
     all_functions = []
-    for binary in binaries:
-        binary_path = binary["path"] if isinstance(binary, dict) else binary
-        extract = getattr(lifter, "extract_functions", None)
-        if extract is None:
-            # Fallback to a generic process method if present
-            process_method = getattr(lifter, "process_binary", None)
-            if process_method is None:
-                raise AttributeError("Function extraction API not available in lifter.")
-            result = process_method(Path(binary_path), Path(output_dir))
-            if result is not None:
-                all_functions.append({"binary": binary_path, "artifact": str(result)})
-        else:
-            functions = extract(binary_path)
-            all_functions.extend(functions)
+    if binary_paths:
+        with worker_logging() as (init, init_args), \
+                ProcessPoolExecutor(max_workers=max_workers, initializer=init, initargs=init_args) as ex:
+            for functions in ex.map(_lift_one, binary_paths, [output_dir] * len(binary_paths)):
+                all_functions.extend(functions)
     logger.info(f"Extracted {len(all_functions)} functions")
     
     # Step 4: Run ML detection
@@ -138,63 +170,9 @@ def train(model_type: str, data_dir: str, output_dir: str):
     logger.info("Training complete!")
 
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="Crypto Finder - Automated Cryptographic Function Detection"
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Analyze command
-    analyze_parser = subparsers.add_parser('analyze', help='Analyze firmware binary')
-    analyze_parser.add_argument('firmware', help='Path to firmware binary')
-    analyze_parser.add_argument('--output', '-o', default='results/', help='Output directory')
-    analyze_parser.add_argument('--config', '-c', default='config/base.yaml', help='Config file')
-    
-    # Build-dataset command
-    dataset_parser = subparsers.add_parser('build-dataset', help='Build training dataset')
-    dataset_parser.add_argument('--config', '-c', required=True, help='Dataset config YAML')
-    dataset_parser.add_argument('--output', '-o', default='data/01_compiled/', help='Output directory')
-    
-    # Train command
-    train_parser = subparsers.add_parser('train', help='Train ML model')
-    train_parser.add_argument('--model-type', '-m', default='rf', choices=['rf', 'gb', 'neural'])
-    train_parser.add_argument('--data', '-d', default='data/04_datasets/', help='Training data directory')
-    train_parser.add_argument('--output', '-o', default='data/06_models/', help='Model output directory')
-    
-    args = parser.parse_args()
-    
-    if args.command == 'analyze':
-        config = load_config(args.config)
-        analyze_firmware(args.firmware, args.output, config)
-    
-    elif args.command == 'build-dataset':
-        build_dataset(args.config, args.output)
-    
-    elif args.command == 'train':
-        train(args.model_type, args.data, args.output)
-    
-    else:
-        parser.print_help()
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
-
-# Hinglish: Hum yahan main.py ko update kar rahe hain taaki naya 'dynamic-run' command add ho sake.
-
-import typer
-from crypto_finder.common.logging import log
-
-# Lifter, Static Scanner, Symbolic, aur Dynamic se unke CLI functions ko import karo.
-from crypto_finder.lifter.cli import lift
-from crypto_finder.static_scanner.cli import scan
-from crypto_finder.symbolic.cli import analyze_loops
-from crypto_finder.dynamic_runner.cli import dynamic_run
-
-# Main Typer application object.
+# Main Typer application object. Subcommand modules only import their heavy
+# dependencies (angr, yara, z3, unicorn) when the command actually runs, so
+# `crypto-finder --help` stays fast.
 app = typer.Typer(
     name="crypto-finder",
     help="A robust framework for finding cryptographic primitives in firmware. 🚀",
@@ -208,6 +186,41 @@ app.command(name="symbolic-loops")(analyze_loops)
 app.command(name="dynamic-run")(dynamic_run)
 
 
+@app.command(name="analyze")
+def analyze_cmd(
+    firmware: str = typer.Argument(..., help="Path to firmware binary"),
+    output: str = typer.Option("results/", "--output", "-o", help="Output directory"),
+    config: str = typer.Option("config/base.yaml", "--config", "-c", help="Config file"),
+):
+    """
+    Analyze firmware binary
+    """
+    analyze_firmware(firmware, output, load_config(config))
+
+
+@app.command(name="build-dataset")
+def build_dataset_cmd(
+    config: str = typer.Option(..., "--config", "-c", help="Dataset config YAML"),
+    output: str = typer.Option("data/01_compiled/", "--output", "-o", help="Output directory"),
+):
+    """
+    Build training dataset
+    """
+    build_dataset(config, output)
+
+
+@app.command(name="train")
+def train_cmd(
+    model_type: ModelType = typer.Option(ModelType.rf, "--model-type", "-m"),
+    data: str = typer.Option("data/04_datasets/", "--data", "-d", help="Training data directory"),
+    output: str = typer.Option("data/06_models/", "--output", "-o", help="Model output directory"),
+):
+    """
+    Train ML model
+    """
+    train(model_type.value, data, output)
+
+
 @app.callback()
 def main_callback():
     """
@@ -215,5 +228,6 @@ def main_callback():
     """
     log.info("Crypto Finder main CLI invoked.")
 
+
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
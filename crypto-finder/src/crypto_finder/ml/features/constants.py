@@ -4,14 +4,43 @@ Constant-based features (e.g., S-boxes, IVs) presence indicators
 
 from typing import Dict
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup, one `in` scan per constant otherwise
+    ahocorasick = None
+
 WELL_KNOWN_CONSTANTS = {
     'aes_sbox_head': bytes([0x63, 0x7c, 0x77, 0x7b]),
     'md5_iv': bytes.fromhex('67452301efcdab8998badcfe10325476'),
 }
 
 
-def constant_hits(data: bytes) -> Dict[str, int]:
-    hits: Dict[str, int] = {}
+def _build_automaton():
+    # PyPI wheels are str-only builds; latin-1 maps each byte to one char
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
     for name, pattern in WELL_KNOWN_CONSTANTS.items():
-        hits[f'const_{name}'] = int(pattern in data)
+        automaton.add_word(pattern.decode('latin-1'), f'const_{name}')
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import: every constant is found in a single pass over data
+_AUTOMATON = _build_automaton()
+
+
+def constant_hits(data: bytes) -> Dict[str, int]:
+    hits: Dict[str, int] = {f'const_{name}': 0 for name in WELL_KNOWN_CONSTANTS}
+    if _AUTOMATON is None:
+        for name, pattern in WELL_KNOWN_CONSTANTS.items():
+            hits[f'const_{name}'] = int(pattern in data)
+        return hits
+    remaining = len(hits)
+    for _, key in _AUTOMATON.iter(bytes(data).decode('latin-1')):
+        if not hits[key]:
+            hits[key] = 1
+            remaining -= 1
+            if not remaining:
+                break
     return hits
@@ -2,13 +2,46 @@
 Neural embeddings utilities placeholder
 """
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
+
+import numpy as np
+
+# Longer grams are sparse enough that the key formatting, not the
+# counting, dominates; they keep the slice-and-dict path
+_MAX_PACKED_N = 2
+
+
+@lru_cache(maxsize=None)
+def _gram_keys(n: int) -> List[str]:
+    # Feature names for every n-gram code (at most 65536 for n = 2)
+    width = 2 * n
+    return [f"ng_{g:0{width}x}" for g in range(1 << (8 * n))]
 
 
 def byte_ngram_embedding(function_bytes: bytes, n: int = 2) -> Dict[str, float]:
     # Simple n-gram counts normalized
     if not function_bytes:
         return {}
+    if n > _MAX_PACKED_N:
+        return _byte_ngram_embedding_slices(function_bytes, n)
+    return _packed_ngram_embedding(np.frombuffer(function_bytes, dtype=np.uint8), n)
+
+
+def _packed_ngram_embedding(buf: np.ndarray, n: int) -> Dict[str, float]:
+    num = buf.size - n + 1
+    if num <= 0:
+        return {}
+    # Pack each gram big-endian into one integer code
+    codes = np.zeros(num, dtype=np.uint32)
+    for k in range(n):
+        codes = (codes << 8) | buf[k:k + num]
+    grams, counts = np.unique(codes, return_counts=True)
+    keys = _gram_keys(n)
+    return dict(zip([keys[g] for g in grams.tolist()], (counts / num).tolist()))
+
+
+def _byte_ngram_embedding_slices(function_bytes: bytes, n: int) -> Dict[str, float]:
     counts: Dict[bytes, int] = {}
     for i in range(len(function_bytes) - n + 1):
         g = function_bytes[i:i+n]
@@ -0,0 +1,197 @@
+"""
+All byte-level features for one function from a single array view
+
+Prefer extract_all over calling summarize_bytes, basic_structural_features,
+compute_byte_histogram, constant_hits and byte_ngram_embedding one by one:
+those each re-read the bytes, here one bincount feeds every statistic.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from crypto_finder.ml.features.constants import WELL_KNOWN_CONSTANTS, constant_hits
+from crypto_finder.ml.features.embeddings import (
+    _MAX_PACKED_N,
+    _byte_ngram_embedding_slices,
+    _packed_ngram_embedding,
+)
+from crypto_finder.ml.features.statistical import _fold_bins, _segment_counts
+
+HIST_BINS = 16
+
+# One fixed-layout record per function. Every field is float32, so a filled
+# array is also a plain matrix: feats.view(np.float32).reshape(len(feats), -1).
+# N-grams stay in extract_all: 65536 dense columns per function would dwarf
+# everything else.
+FEATURE_DTYPE = np.dtype(
+    [(name, np.float32) for name in ('size', 'is_tiny', 'is_large', 'mean', 'entropy')]
+    + [(f'const_{name}', np.float32) for name in WELL_KNOWN_CONSTANTS]
+    + [('hist', np.float32, (HIST_BINS,))]
+)
+
+
+def extract_all(function_bytes: bytes, num_bins: int = 16, ngram_n: int = 2) -> Dict[str, float]:
+    """
+    Flat feature dict with the keys of the per-metric functions
+
+    Histogram bins are reported as `hist_<i>`.
+    """
+    arr = np.frombuffer(function_bytes, dtype=np.uint8)
+    length = arr.size
+    n = length or 1
+    counts = np.bincount(arr, minlength=256)
+
+    p = counts[counts > 0] / n
+    features: Dict[str, float] = {
+        'len': float(length),
+        'mean': float(counts @ np.arange(256) / n) if length else 0.0,
+        'entropy': float(-(p * np.log2(p)).sum()) if length else 0.0,
+        'size_bytes': float(length),
+        'is_tiny': float(length < 32),
+        'is_large': float(length > 4096),
+    }
+    hist = (_fold_bins(counts, num_bins) / n).tolist()
+    features.update((f'hist_{i}', v) for i, v in enumerate(hist))
+    features.update((k, float(v)) for k, v in constant_hits(function_bytes).items())
+    if length:
+        if ngram_n > _MAX_PACKED_N:
+            features.update(_byte_ngram_embedding_slices(bytes(function_bytes), ngram_n))
+        else:
+            features.update(_packed_ngram_embedding(arr, ngram_n))
+    return features
+
+
+def _extract_columns(blobs: Sequence[bytes], num_bins: int = 16) -> Dict[str, np.ndarray]:
+    """
+    Columnar extract_all (without n-grams) for many functions at once
+
+    All bodies are counted in one segmented bincount; every column holds
+    one value per blob, in order.
+    """
+    if not blobs:
+        return {}
+    counts, lengths = _segment_counts(blobs)
+    n = np.maximum(lengths, 1)
+    p = counts / n[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plogp = np.where(counts > 0, p * np.log2(p), 0.0)
+
+    columns: Dict[str, np.ndarray] = {
+        'len': lengths.astype(np.float64),
+        'mean': counts @ np.arange(256) / n,
+        'entropy': -plogp.sum(axis=1),
+        'size_bytes': lengths.astype(np.float64),
+        'is_tiny': (lengths < 32).astype(np.float64),
+        'is_large': (lengths > 4096).astype(np.float64),
+    }
+    hist = _fold_bins(counts, num_bins) / n[:, None]
+    columns.update((f'hist_{i}', hist[:, i]) for i in range(hist.shape[1]))
+    hits = [constant_hits(b) for b in blobs]
+    for key in hits[0]:
+        columns[key] = np.fromiter((h[key] for h in hits), dtype=np.float64, count=len(hits))
+    return columns
+
+
+def extract_into(row: np.void, data: bytes) -> None:
+    """
+    Fill one FEATURE_DTYPE record in place, e.g. extract_into(feats[i], data)
+    """
+    arr = np.frombuffer(data, dtype=np.uint8)
+    length = arr.size
+    n = length or 1
+    counts = np.bincount(arr, minlength=256)
+    p = counts[counts > 0] / n
+    row['size'] = length
+    row['is_tiny'] = length < 32
+    row['is_large'] = length > 4096
+    row['mean'] = counts @ np.arange(256) / n
+    row['entropy'] = -(p * np.log2(p)).sum() if length else 0.0
+    for key, hit in constant_hits(data).items():
+        row[key] = hit
+    row['hist'] = _fold_bins(counts, HIST_BINS) / n
+
+
+def extract_records(blobs: Sequence[bytes]) -> np.ndarray:
+    """
+    FEATURE_DTYPE array for many functions, filled from _extract_columns
+    """
+    feats = np.zeros(len(blobs), dtype=FEATURE_DTYPE)
+    if not blobs:
+        return feats
+    columns = _extract_columns(blobs, num_bins=HIST_BINS)
+    feats['size'] = columns['size_bytes']
+    for name in FEATURE_DTYPE.names:
+        if name not in ('size', 'hist'):
+            feats[name] = columns[name]
+    feats['hist'] = np.column_stack([columns[f'hist_{i}'] for i in range(HIST_BINS)])
+    return feats
+
+
+def _extract_range(shm_name: str, size: int, offsets: np.ndarray, ngram_n: int) -> List[Dict[str, float]]:
+    # Worker: attach to the shared blob; only the offsets travel through the pipe
+    shm = shared_memory.SharedMemory(name=shm_name)
+    flat = np.ndarray((size,), dtype=np.uint8, buffer=shm.buf)
+    try:
+        return [
+            extract_all(flat[lo:hi].tobytes(), ngram_n=ngram_n)
+            for lo, hi in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+    finally:
+        # The view must go before close() can release the mapping
+        del flat
+        shm.close()
+
+
+def extract_all_parallel(
+    blobs: Sequence[bytes],
+    max_workers: Optional[int] = None,
+    ngram_n: int = 2,
+    min_parallel: int = 256
+) -> List[Dict[str, float]]:
+    """
+    extract_all for every blob, split across worker processes
+
+    The bodies are concatenated once into a SharedMemory block; each worker
+    gets a contiguous index range and reads its bytes from there.
+
+    Args:
+        blobs: Function bodies
+        max_workers: Worker processes (default: CPU count)
+        ngram_n: n-gram length passed to extract_all
+        min_parallel: Below this many blobs, run in-process
+
+    Returns:
+        One feature dict per blob, in input order
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if len(blobs) < min_parallel or workers == 1:
+        return [extract_all(b, ngram_n=ngram_n) for b in blobs]
+
+    lengths = np.fromiter((len(b) for b in blobs), dtype=np.int64, count=len(blobs))
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    size = int(offsets[-1])
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        flat = np.ndarray((size,), dtype=np.uint8, buffer=shm.buf)
+        for b, lo, hi in zip(blobs, offsets[:-1].tolist(), offsets[1:].tolist()):
+            flat[lo:hi] = np.frombuffer(b, dtype=np.uint8)
+        del flat
+
+        bounds = np.linspace(0, len(blobs), workers + 1, dtype=np.int64)
+        results: List[Dict[str, float]] = []
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                ex.submit(_extract_range, shm.name, size, offsets[lo:hi + 1], ngram_n)
+                for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+                if hi > lo
+            ]
+            for future in futures:
+                results.extend(future.result())
+        return results
+    finally:
+        shm.close()
+        shm.unlink()
@@ -2,38 +2,80 @@
 Statistical features for function representations
 """
 
-from typing import List, Dict
-import math
+from typing import List, Dict, Sequence, Tuple
 
+import numpy as np
 
-def compute_byte_histogram(data: bytes, num_bins: int = 16) -> List[float]:
+
+def _fold_bins(counts: np.ndarray, num_bins: int) -> np.ndarray:
+    # Fold 256 per-byte counts (last axis) into num_bins equal-width bins
     bin_size = 256 // num_bins
-    counts = [0] * num_bins
-    for b in data:
-        counts[b // bin_size] += 1
+    if bin_size * num_bins == 256:
+        return counts.reshape(*counts.shape[:-1], num_bins, bin_size).sum(-1)
+    # Uneven widths spill into extra trailing bins, as b // bin_size would
+    return np.add.reduceat(counts, np.arange(0, 256, bin_size), axis=-1)
+
+
+def compute_byte_histogram(data: bytes, num_bins: int = 16) -> List[float]:
+    # Count all 256 values, then fold: no per-byte division pass
+    arr = np.frombuffer(data, dtype=np.uint8)
+    counts = _fold_bins(np.bincount(arr, minlength=256), num_bins)
     total = len(data) or 1
-    return [c / total for c in counts]
+    return (counts / total).tolist()
+
+
+def compute_byte_histograms_batch(chunks: Sequence[bytes], num_bins: int = 16) -> List[List[float]]:
+    """
+    compute_byte_histogram for many buffers with one bincount over their concatenation
+    """
+    if not chunks:
+        return []
+    counts, lengths = _segment_counts(chunks)
+    totals = np.maximum(lengths, 1)[:, None]
+    return (_fold_bins(counts, num_bins) / totals).tolist()
+
+
+def _segment_counts(chunks: Sequence[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (len(chunks), 256) byte counts and the chunk lengths, from one bincount
+    """
+    lengths = np.fromiter((len(c) for c in chunks), dtype=np.int64, count=len(chunks))
+    arr = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+    # Offset each byte by 256 * its segment index so segments count apart
+    seg = np.repeat(np.arange(len(chunks), dtype=np.int64) * 256, lengths)
+    counts = np.bincount(seg + arr, minlength=256 * len(chunks)).reshape(len(chunks), 256)
+    return counts, lengths
+
+
+def _build_entropy_lut(max_n: int) -> np.ndarray:
+    # _ENTROPY_LUT[n, c] = -(c/n) * log2(c/n), zero for c = 0 and c > n
+    lut = np.zeros((max_n + 1, max_n + 1))
+    for n in range(1, max_n + 1):
+        p = np.arange(1, n + 1) / n
+        lut[n, 1:n + 1] = -p * np.log2(p)
+    return lut
+
+
+# Most extracted functions are short thunks; their entropy is a table lookup
+_LUT_MAX_N = 256
+_ENTROPY_LUT = _build_entropy_lut(_LUT_MAX_N)
 
 
 def shannon_entropy(data: bytes) -> float:
     if not data:
         return 0.0
-    freq = [0] * 256
-    for b in data:
-        freq[b] += 1
-    total = len(data)
-    entropy = 0.0
-    for c in freq:
-        if c == 0:
-            continue
-        p = c / total
-        entropy -= p * math.log2(p)
-    return entropy
+    arr = np.frombuffer(data, dtype=np.uint8)
+    counts = np.bincount(arr, minlength=256)
+    if len(data) <= _LUT_MAX_N:
+        return float(_ENTROPY_LUT[len(data), counts].sum())
+    p = counts[counts > 0] / len(data)
+    return float(-(p * np.log2(p)).sum())
 
 
 def summarize_bytes(data: bytes) -> Dict[str, float]:
+    arr = np.frombuffer(data, dtype=np.uint8)
     return {
         'len': float(len(data)),
-        'mean': float(sum(data) / (len(data) or 1)),
+        'mean': float(arr.mean()) if len(data) else 0.0,
         'entropy': shannon_entropy(data),
     }
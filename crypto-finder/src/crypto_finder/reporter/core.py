@@ -2,49 +2,42 @@
 HTML report generation for analysis results
 """
 
+import html
 import json
 from pathlib import Path
-from typing import List, Dict
+from string import Template
+from typing import Iterator, List, Dict
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json otherwise
+    orjson = None
 
-class ReportGenerator:
-    def __init__(self, output_dir: str):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate_report(self, detections: List[Dict], firmware_path: str) -> str:
-        html_path = self.output_dir / "report.html"
-        data_path = self.output_dir / "detections.json"
-        data_path.write_text(json.dumps(detections, indent=2))
-        html = self._render_html(firmware_path, detections)
-        html_path.write_text(html)
-        return str(html_path)
 
-    def _render_html(self, firmware_path: str, detections: List[Dict]) -> str:
-        rows = "\n".join(
-            f"<tr><td>{i+1}</td><td>{d.get('function')}</td><td>{d.get('label')}</td><td>{d.get('confidence')}</td></tr>"
-            for i, d in enumerate(detections)
-        )
-        return f"""
+# Page boilerplate is built once; only the rows are formatted per report.
+# Every interpolated value is HTML-escaped.
+_PAGE_HEAD = Template("""
 <!DOCTYPE html>
 <html>
 <head>
   <meta charset=\"utf-8\" />
   <title>Crypto Finder Report</title>
   <style>
-    body {{ font-family: Arial, sans-serif; margin: 2rem; }}
-    table {{ border-collapse: collapse; width: 100%; }}
-    th, td {{ border: 1px solid #ccc; padding: 8px; text-align: left; }}
-    th {{ background: #f6f6f6; }}
+    body { font-family: Arial, sans-serif; margin: 2rem; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ccc; padding: 8px; text-align: left; }
+    th { background: #f6f6f6; }
   </style>
   </head>
 <body>
   <h1>Crypto Finder Report</h1>
-  <p><strong>Firmware:</strong> {firmware_path}</p>
+  <p><strong>Firmware:</strong> $firmware</p>
   <table>
     <thead><tr><th>#</th><th>Function</th><th>Label</th><th>Confidence</th></tr></thead>
     <tbody>
-    {rows}
+    """)
+_ROW = Template("<tr><td>$i</td><td>$function</td><td>$label</td><td>$confidence</td></tr>")
+_PAGE_TAIL = """
     </tbody>
   </table>
   <p>Raw detections saved alongside as detections.json</p>
@@ -53,3 +46,52 @@ class ReportGenerator:
 """
 
 
+class ReportGenerator:
+    def __init__(self, output_dir: str):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def generate_report(self, detections: List[Dict], firmware_path: str) -> str:
+        html_path = self.output_dir / "report.html"
+        data_path = self.output_dir / "detections.json"
+        self._write_json(data_path, detections)
+        # Rows are written as they are formatted; the page is never held whole
+        with html_path.open('w') as f:
+            f.writelines(self._iter_html(firmware_path, detections))
+        return str(html_path)
+
+    @staticmethod
+    def _write_json(path: Path, detections: List[Dict]) -> None:
+        if orjson is not None:
+            try:
+                data = orjson.dumps(
+                    detections,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            except (orjson.JSONEncodeError, TypeError):
+                # e.g. ints above 64 bits; stdlib json takes anything it did before
+                pass
+            else:
+                path.write_bytes(data)
+                return
+        # json.dump streams chunks to the file instead of building one string.
+        # orjson writes non-ASCII as raw UTF-8, json as \u escapes: both parse
+        # to the same data, but the files are not byte-identical.
+        with path.open('w') as f:
+            json.dump(detections, f, indent=2)
+
+    def _render_html(self, firmware_path: str, detections: List[Dict]) -> str:
+        return "".join(self._iter_html(firmware_path, detections))
+
+    def _iter_html(self, firmware_path: str, detections: List[Dict]) -> Iterator[str]:
+        yield _PAGE_HEAD.substitute(firmware=html.escape(str(firmware_path)))
+        for i, d in enumerate(detections):
+            if i:
+                yield "\n"
+            yield _ROW.substitute(
+                i=i + 1,
+                function=html.escape(str(d.get('function'))),
+                label=html.escape(str(d.get('label'))),
+                confidence=html.escape(str(d.get('confidence'))),
+            )
+        yield _PAGE_TAIL
@@ -3,7 +3,6 @@
 import typer
 from pathlib import Path
 import json
-from crypto_finder.static_scanner.core import StaticScanner
 from crypto_finder.common.logging import log
 # 'settings' ke saath-saath ab 'ROOT_DIR' ko bhi directly import karo.
 from crypto_finder.common.config import settings, ROOT_DIR
@@ -45,6 +44,7 @@ def scan(
     """
     log.info(f"CLI command invoked to scan '{binary_path.name}'.")
     try:
+        from crypto_finder.static_scanner.core import StaticScanner
         scanner = StaticScanner(rules_path=rules_path)
         results = scanner.scan(binary_path=binary_path)
 
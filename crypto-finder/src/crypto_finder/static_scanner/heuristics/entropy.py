@@ -2,26 +2,34 @@
 Entropy heuristic: flag high-entropy regions likely to be keys/ciphertext
 """
 
-import math
 from typing import List, Tuple
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Windows histogrammed per bincount call; bounds the (batch, 256) scratch array
+_BATCH = 1024
+
 
 def window_entropy(data: bytes, window: int = 256, step: int = 64, threshold: float = 7.5) -> List[Tuple[int, float]]:
     hits: List[Tuple[int, float]] = []
     n = len(data)
-    for start in range(0, max(0, n - window + 1), step):
-        chunk = data[start:start+window]
-        freq = [0] * 256
-        for b in chunk:
-            freq[b] += 1
-        ent = 0.0
-        for c in freq:
-            if c == 0:
-                continue
-            p = c / window
-            ent -= p * math.log2(p)
-        if ent >= threshold:
-            hits.append((start, ent))
+    if n < window:
+        return hits
+    arr = np.frombuffer(data, dtype=np.uint8)
+    # Every window has the same length, so -p*log2(p) only takes window + 1
+    # values: index them by count instead of taking logs per bin
+    p = np.arange(window + 1) / window
+    plogp = -p * np.log2(p, out=np.zeros_like(p), where=p > 0)
+    # (n_windows, window) view, no copy
+    windows = sliding_window_view(arr, window)[::step]
+    for first in range(0, len(windows), _BATCH):
+        batch = windows[first:first + _BATCH]
+        rows = len(batch)
+        # Offset each window's bytes into its own 256-bin slot: one bincount per batch
+        offsets = (np.arange(rows, dtype=np.intp) * 256)[:, None]
+        hist = np.bincount((batch + offsets).ravel(), minlength=rows * 256).reshape(rows, 256)
+        ent = plogp[hist].sum(axis=1)
+        idx = np.flatnonzero(ent >= threshold)
+        hits.extend(zip(((first + idx) * step).tolist(), ent[idx].tolist()))
     return hits
-
-
@@ -2,16 +2,19 @@
 Loop detection heuristic placeholder
 """
 
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
 
+import numpy as np
 
-def detect_simple_loops(opcodes: List[int]) -> List[Dict]:
-    # Placeholder: detect back-edges in a fake linear CFG using jumps
-    loops: List[Dict] = []
-    for i, op in enumerate(opcodes):
-        if op == 0xE9:  # x86 jmp rel32 (placeholder)
-            # Fake a loop
-            loops.append({'at': i, 'type': 'backedge'})
-    return loops
+# x86 jmp rel32 (placeholder); more opcodes can go through np.isin later
+_JMP_REL32 = 0xE9
 
 
+def detect_simple_loops(opcodes: Union[bytes, Sequence[int]]) -> List[Dict]:
+    # Placeholder: detect back-edges in a fake linear CFG using jumps
+    if isinstance(opcodes, (bytes, bytearray, memoryview)):
+        arr = np.frombuffer(opcodes, dtype=np.uint8)
+    else:
+        arr = np.asarray(opcodes)
+    # One vectorized compare instead of a per-opcode Python loop
+    return [{'at': i, 'type': 'backedge'} for i in np.flatnonzero(arr == _JMP_REL32).tolist()]
@@ -2,7 +2,6 @@
 
 import typer
 from pathlib import Path
-from crypto_finder.symbolic.loop_analyzer import SymbolicAnalyzer
 from crypto_finder.common.logging import log
 
 def analyze_loops(
@@ -22,6 +21,7 @@ def analyze_loops(
     """
     log.info(f"CLI command invoked for symbolic loop analysis on '{binary_path.name}'.")
     try:
+        from crypto_finder.symbolic.loop_analyzer import SymbolicAnalyzer
         analyzer = SymbolicAnalyzer(binary_path=binary_path)
         loops = analyzer.find_loops()
         
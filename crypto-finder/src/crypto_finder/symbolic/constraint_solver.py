@@ -2,36 +2,176 @@
 Basic Z3 wrapper for simple constraint solving (optional dependency)
 """
 
-from typing import Optional
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Dict, Optional, Sequence, Tuple
 from crypto_finder.common.logging import log
 
+# The same loop templates recur across binaries; solves can take seconds
+_CACHE_SIZE = 4096
+_SAT_CACHE: "OrderedDict[bytes, bool]" = OrderedDict()
+_LOCK = threading.Lock()
 
-def check_satisfiable(expr_src: str) -> Optional[bool]:
+# The only callables a constraint may use, looked up in z3 by name
+_Z3_FUNCTIONS = (
+    'And', 'Or', 'Not', 'Xor', 'Implies', 'If', 'Distinct',
+    'ULT', 'ULE', 'UGT', 'UGE', 'UDiv', 'URem', 'LShR',
+    'RotateLeft', 'RotateRight', 'Extract', 'Concat', 'ZeroExt', 'SignExt',
+    'BitVecVal', 'IntVal', 'BoolVal',
+)
+
+# Expression nodes a constraint may contain: no attributes, subscripts,
+# comprehensions or lambdas, so there is no way back to Python internals
+_ALLOWED_NODES = (
+    ast.Expression, ast.BoolOp, ast.BinOp, ast.UnaryOp, ast.Compare,
+    ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.And, ast.Or, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
+    ast.LShift, ast.RShift, ast.BitOr, ast.BitXor, ast.BitAnd,
+    ast.Invert, ast.Not, ast.UAdd, ast.USub,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+# Python's and/or/not and chained comparisons call bool() on z3 expressions,
+# which raises (or silently short-circuits); they are rewritten to these
+_BOOL_FUNCTIONS = {'__And': 'And', '__Or': 'Or', '__Not': 'Not'}
+
+
+class _BoolRewriter(ast.NodeTransformer):
     """
-    Evaluate a simple Z3 Python expression string and return satisfiable state.
-    The `expr_src` should define a `solver` variable of type z3.Solver.
+    Rewrite and/or/not and chained comparisons into z3 And/Or/Not calls
+    """
+
+    @staticmethod
+    def _call(name: str, args: list) -> ast.Call:
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        name = '__And' if isinstance(node.op, ast.And) else '__Or'
+        return self._call(name, node.values)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self._call('__Not', [node.operand])
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        # a < b < c -> And(a < b, b < c)
+        operands = [node.left] + node.comparators
+        pairs = [
+            ast.Compare(left=operands[i], ops=[op], comparators=[operands[i + 1]])
+            for i, op in enumerate(node.ops)
+        ]
+        return self._call('__And', pairs)
+
+
+def _lru_get(cache: OrderedDict, key: bytes) -> Any:
+    with _LOCK:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+
+def _lru_put(cache: OrderedDict, key: bytes, value: Any) -> None:
+    with _LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _compile_constraint(src: str) -> CodeType:
+    """
+    Parse one constraint expression, reject anything outside the whitelist
+    """
+    tree = ast.parse(src, mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Disallowed syntax in constraint: {type(node).__name__}")
+        if isinstance(node, ast.Call) and not isinstance(node.func, ast.Name):
+            raise ValueError("Only whitelisted z3 functions may be called")
+        if isinstance(node, ast.Name) and node.id.startswith('_'):
+            raise ValueError(f"Disallowed name in constraint: {node.id}")
+    tree = ast.fix_missing_locations(_BoolRewriter().visit(tree))
+    return compile(tree, '<sat>', 'eval')
+
+
+def _declare(z3: Any, name: str, sort: str) -> Any:
+    # sort: "int", "bool", "real" or "bv<width>" (e.g. "bv32")
+    if sort == 'int':
+        return z3.Int(name)
+    if sort == 'bool':
+        return z3.Bool(name)
+    if sort == 'real':
+        return z3.Real(name)
+    if sort.startswith('bv') and sort[2:].isdigit():
+        return z3.BitVec(name, int(sort[2:]))
+    raise ValueError(f"Unknown sort for {name}: {sort}")
+
+
+def check_satisfiable(
+    declarations: Sequence[Tuple[str, str]],
+    constraints: Sequence[str]
+) -> Optional[bool]:
+    """
+    Check whether constraints over the declared variables are satisfiable.
+
+    `declarations` are (name, sort) pairs with sort "int", "bool", "real" or
+    "bv<width>". Each constraint is a Python expression over those names,
+    operators and whitelisted z3 functions (And, Or, ULT, Extract, ...);
+    `and`/`or`/`not` and chained comparisons are translated to z3 And/Or/Not.
+    Decided (sat/unsat) results are memoized.
     """
     try:
-        import z3  # noqa: F401
+        import z3
     except Exception:
         log.warning("z3-solver not installed; cannot check satisfiability")
         return None
 
-    local_ns = {}
+    key = hashlib.blake2b(
+        repr((tuple(map(tuple, declarations)), tuple(constraints))).encode(),
+        digest_size=16
+    ).digest()
+    cached = _lru_get(_SAT_CACHE, key)
+    if cached is not None:
+        return cached
+
     try:
-        exec(expr_src, {}, local_ns)
-        solver = local_ns.get('solver')
-        if solver is None:
-            log.error("No solver found in expression context")
-            return None
+        namespace: Dict[str, Any] = {name: getattr(z3, name) for name in _Z3_FUNCTIONS}
+        for name, sort in declarations:
+            namespace[name] = _declare(z3, name, sort)
+        # After declarations, so a variable can't shadow the rewrite targets
+        namespace.update({alias: getattr(z3, name) for alias, name in _BOOL_FUNCTIONS.items()})
+        solver = z3.Solver()
+        for src in constraints:
+            solver.add(eval(_compile_constraint(src), {'__builtins__': {}}, namespace))
         res = solver.check()
-        if res.r == 1:
-            return True
-        if res.r == -1:
+        if res == z3.unknown:
+            # unknown is often a timeout; a later call may still decide it
             return None
-        return False
+        result = res == z3.sat
     except Exception as e:
         log.error(f"Constraint eval failed: {e}")
         return None
+    _lru_put(_SAT_CACHE, key, result)
+    return result
+
+
+def _cache_clear() -> None:
+    with _LOCK:
+        _SAT_CACHE.clear()
+    _compile_constraint.cache_clear()
 
 
+check_satisfiable.cache_clear = _cache_clear
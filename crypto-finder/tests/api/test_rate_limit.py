@@ -0,0 +1,86 @@
+# Hinglish: token-bucket rate_limit dependency ke liye tests, nakli ghadi (clock) ke saath.
+
+import asyncio
+import types
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+
+from crypto_finder.api.middleware import rate_limit as rl  # noqa: E402
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = types.SimpleNamespace(t=1000.0)
+    monkeypatch.setattr(rl, "time", types.SimpleNamespace(monotonic=lambda: now.t))
+    return now
+
+
+def _call(dep, client="c"):
+    try:
+        asyncio.run(dep(client))
+    except fastapi.HTTPException as e:
+        assert e.status_code == 429
+        return False
+    return True
+
+
+def test_rejects_once_capacity_is_spent(clock):
+    dep = rl.rate_limit(capacity=3, rate=1)
+    assert [_call(dep) for _ in range(4)] == [True, True, True, False]
+    # Buckets are per client
+    assert _call(dep, "other")
+
+
+def test_refills_at_rate_up_to_capacity(clock):
+    dep = rl.rate_limit(capacity=2, rate=4)
+    assert _call(dep) and _call(dep) and not _call(dep)
+
+    clock.t += 0.25  # one token back
+    assert _call(dep)
+    assert not _call(dep)
+
+    clock.t += 100  # refill stops at capacity
+    assert [_call(dep) for _ in range(3)] == [True, True, False]
+
+
+def test_limiters_do_not_share_buckets(clock):
+    strict = rl.rate_limit(capacity=1, rate=1)
+    loose = rl.rate_limit(capacity=5, rate=1)
+    assert _call(strict) and not _call(strict)
+    assert _call(loose)
+
+
+def test_idle_buckets_are_swept(clock, monkeypatch):
+    swept = []
+    real_sweep = rl._sweep
+
+    def spy(buckets, now, idle_s):
+        real_sweep(buckets, now, idle_s)
+        swept.append(sorted(buckets))
+
+    monkeypatch.setattr(rl, "_sweep", spy)
+    dep = rl.rate_limit(capacity=1, rate=1)  # idle after 10 s
+    _call(dep, "old")
+    assert swept == [["old"]]
+
+    clock.t += 5
+    _call(dep, "new")
+    assert len(swept) == 1  # sweeps run at most once per idle period
+
+    clock.t += 6  # "old" idle 11 s, "new" 6 s
+    _call(dep, "third")
+    assert swept[-1] == ["new", "third"]
+
+
+def test_sweep_drops_only_idle_buckets():
+    buckets = {"idle": (0.0, 10.0), "busy": (0.0, 95.0)}
+    rl._sweep(buckets, now=100.0, idle_s=10.0)
+    assert buckets == {"busy": (0.0, 95.0)}
+
+
+@pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": -1}, {"capacity": 0.5}])
+def test_rejects_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        rl.rate_limit(**kwargs)
@@ -0,0 +1,136 @@
+# Hinglish: common/cache.py ke file cache ke liye tests.
+
+import threading
+
+import pytest
+
+from crypto_finder.common import cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_disk_key_separates_arguments():
+    assert cache._disk_key("ab", "c") != cache._disk_key("a", "bc")
+    assert cache._disk_key(b"x") != cache._disk_key("x")
+    assert cache._disk_key(1, a=2) == cache._disk_key(1, a=2)
+    assert cache._disk_key(1, a=2) != cache._disk_key(1, 2)
+
+
+def _spy(monkeypatch, owner, name):
+    # Count calls to owner.name while still running the real thing
+    calls = []
+    real = getattr(owner, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(owner, name, wrapper)
+    return calls
+
+
+def test_file_cache_reuses_json_result(cache_dir, monkeypatch):
+    calls = []
+    reads = _spy(monkeypatch, cache, "_read_entry")
+
+    # mem_cache=0: the second call must come from the JSON file
+    @cache.file_cache("json_ns", mem_cache=0)
+    def compute(x):
+        calls.append(x)
+        return {"value": x * 2}
+
+    assert compute(3) == {"value": 6}
+    assert reads == []
+    assert compute(3) == {"value": 6}
+    assert calls == [3]
+    assert len(reads) == 1
+    assert len(list((cache_dir / "json_ns").glob("*.json"))) == 1
+
+
+def test_file_cache_pickles_non_json_results(cache_dir, monkeypatch):
+    calls = []
+    unpickles = _spy(monkeypatch, cache.pickle, "loads")
+
+    @cache.file_cache("pkl_ns", mem_cache=0)
+    def compute():
+        calls.append(1)
+        return {("x86", "-O2"): 1}
+
+    assert compute() == {("x86", "-O2"): 1}
+    assert compute() == {("x86", "-O2"): 1}
+    assert calls == [1]
+    assert len(unpickles) == 1
+    assert len(list((cache_dir / "pkl_ns").glob("*.pkl"))) == 1
+
+
+def test_large_entries_are_read_back(cache_dir, monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(cache, "_MMAP_THRESHOLD", 16)
+    maps = _spy(monkeypatch, cache.mmap, "mmap")
+    calls = []
+
+    @cache.file_cache("big_ns", mem_cache=0)
+    def compute():
+        calls.append(1)
+        return {"blob": "a" * 64}
+
+    assert compute() == {"blob": "a" * 64}
+    assert compute() == {"blob": "a" * 64}
+    assert calls == [1]
+    assert len(maps) == 1
+
+
+def test_memory_layer_skips_disk_and_evicts(cache_dir):
+    calls = []
+
+    @cache.file_cache("mem_ns", mem_cache=1)
+    def compute(x):
+        calls.append(x)
+        return [x]
+
+    first = compute(1)
+    assert compute(1) is first  # served from memory, not re-parsed
+
+    compute(2)  # evicts 1 from memory
+    for fp in (cache_dir / "mem_ns").iterdir():
+        fp.unlink()
+    compute(1)
+    assert calls == [1, 2, 1]
+
+
+def test_mem_key_falls_back_for_unhashable_args():
+    assert cache._mem_key(1, a=2) == ((1,), (int,), (("a", 2, int),))
+    assert cache._mem_key([1]) == cache._disk_key([1])
+
+
+def test_mem_key_separates_equal_values_of_different_types():
+    keys = {cache._mem_key(v) for v in (1, 1.0, True)}
+    keys |= {cache._mem_key(a=v) for v in (1, 1.0, True)}
+    assert len(keys) == 6
+
+
+def test_atomic_write_from_many_threads(tmp_path):
+    fp = tmp_path / "entry.json"
+    payloads = [bytes([65 + i]) * 200_000 for i in range(8)]
+    errors = []
+
+    def write(data):
+        try:
+            for _ in range(5):
+                cache._atomic_write(fp, data)
+        except Exception as e:  # pragma: no cover - the failure being tested for
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(p,)) for p in payloads]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert fp.read_bytes() in payloads  # one whole payload, never a mix
+    assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
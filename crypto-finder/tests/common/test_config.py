@@ -0,0 +1,46 @@
+# Hinglish: common/config.py ke YAML loading aur overrides ke liye tests.
+
+from crypto_finder.common import config
+
+
+def test_load_config_returns_independent_copies(tmp_path):
+    cfg_file = tmp_path / "base.yaml"
+    cfg_file.write_text("model:\n  batch_size: 32\n")
+
+    first = config.load_config(str(cfg_file))
+    first["model"]["batch_size"] = 1
+
+    assert config.load_config(str(cfg_file))["model"]["batch_size"] == 32
+
+
+def test_load_config_sees_edited_file(tmp_path):
+    cfg_file = tmp_path / "base.yaml"
+    cfg_file.write_text("value: 1\n")
+    assert config.load_config(str(cfg_file))["value"] == 1
+
+    cfg_file.write_text("value: 22\n")
+    assert config.load_config(str(cfg_file))["value"] == 22
+
+
+def test_env_overrides_with_section_separator(monkeypatch):
+    monkeypatch.setenv("CRYPTO_FINDER_MODEL__BATCH_SIZE", "64")
+    monkeypatch.setenv("CRYPTO_FINDER_LOG_LEVEL", "debug")
+    config.refresh_env_overrides()
+    try:
+        result = config.apply_env_overrides({"model": {"lr": 0.1}})
+    finally:
+        monkeypatch.undo()
+        config.refresh_env_overrides()
+
+    assert result["model"] == {"lr": 0.1, "batch_size": 64}
+    assert result["log"] == {"level": "debug"}
+
+
+def test_merge_configs_deep_merges_without_touching_inputs():
+    base = {"model": {"lr": 0.1, "layers": {"hidden": 128}}, "name": "base"}
+    override = {"model": {"layers": {"hidden": 64}}, "name": "dev"}
+
+    merged = config.merge_configs(base, override)
+
+    assert merged == {"model": {"lr": 0.1, "layers": {"hidden": 64}}, "name": "dev"}
+    assert base["model"]["layers"]["hidden"] == 128
@@ -0,0 +1,82 @@
+# Hinglish: common/logging.py ke lazy handler setup ke liye tests.
+# Har test ek alag process me chalta hai taaki root logger ki state saaf rahe.
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parents[2] / "src")
+
+
+def _run(tmp_path, code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"PYTHONPATH": SRC},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_import_creates_no_log_dir(tmp_path):
+    out = _run(tmp_path, (
+        "import logging\n"
+        "from crypto_finder.common.logging import setup_logging, log\n"
+        "setup_logging('a'); setup_logging('b')\n"
+        "print(len(logging.getLogger().handlers))\n"
+    ))
+    assert out.strip() == "1"
+    assert not (tmp_path / "logs").exists()
+
+
+def test_first_record_attaches_handlers_once(tmp_path):
+    out = _run(tmp_path, (
+        "import logging\n"
+        "from crypto_finder.common.logging import setup_logging, log\n"
+        "a = setup_logging('pkg.a', console=False)\n"
+        "b = setup_logging('pkg.b')\n"
+        "a.info('first'); b.warning('second'); log.info('third')\n"
+        "print(sorted(type(h).__name__ for h in logging.getLogger().handlers))\n"
+    ))
+    # console=False from the first call wins
+    assert out.strip() == "['MemoryHandler', 'RotatingFileHandler']"
+    lines = (tmp_path / "logs" / "crypto_finder.log").read_text().splitlines()
+    assert [line.rsplit(" - ", 1)[1] for line in lines] == ["first", "second", "third"]
+
+
+def test_records_below_level_do_not_configure(tmp_path):
+    _run(tmp_path, (
+        "from crypto_finder.common.logging import setup_logging\n"
+        "setup_logging('pkg').debug('ignored')\n"
+    ))
+    assert not (tmp_path / "logs").exists()
+
+
+def test_pool_workers_log_through_parent(tmp_path):
+    _run(tmp_path, (
+        "from concurrent.futures import ProcessPoolExecutor\n"
+        "from crypto_finder.common.logging import setup_logging, worker_logging\n"
+        "logger = setup_logging('pkg', console=False)\n"
+        "def work(i):\n"
+        "    logger.info(f'worker {i}')\n"
+        "    if i == 3:\n"
+        "        logger.error('worker failed')\n"
+        "    return i\n"
+        "if __name__ == '__main__':\n"
+        "    logger.info('parent before')\n"
+        "    with worker_logging() as (init, args), \\\n"
+        "            ProcessPoolExecutor(2, initializer=init, initargs=args) as ex:\n"
+        "        assert list(ex.map(work, range(6))) == list(range(6))\n"
+        "    logger.info('parent after')\n"
+    ))
+    messages = [
+        line.rsplit(" - ", 1)[1]
+        for line in (tmp_path / "logs" / "crypto_finder.log").read_text().splitlines()
+    ]
+    assert messages[0] == "parent before" and messages[-1] == "parent after"
+    # Every worker record once; the inherited parent buffer is not replayed
+    assert sorted(messages[1:-1]) == sorted([f"worker {i}" for i in range(6)] + ["worker failed"])
+    assert (tmp_path / "logs" / "errors.log").read_text().count("worker failed") == 1
@@ -4,6 +4,11 @@ import pytest
 from pathlib import Path
 import subprocess
 
+from crypto_finder.common.logging import setup_logging
+
+# Pehli call ke options jeet-te hain: tests repo me logs/ directory na banayein.
+setup_logging("tests", file_logging=False)
+
 @pytest.fixture(scope="session")
 def test_binary(tmp_path_factory) -> Path:
     """
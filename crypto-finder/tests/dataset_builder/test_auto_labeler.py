@@ -0,0 +1,53 @@
+# Hinglish: AutoLabeler ke vectorized label_dataframe ke liye tests.
+
+import pandas as pd
+import pytest
+
+from crypto_finder.dataset_builder.labeling.auto_labeler import AutoLabeler
+
+COLUMNS = ['algorithm', 'library', 'architecture', 'optimization', 'function_name', 'is_crypto']
+
+
+def _expected(labeler, path):
+    label = labeler.label_function(path, {})['label']
+    return {col: label.get(col) for col in COLUMNS}
+
+
+def _rows(out):
+    return [
+        {col: (None if pd.isna(v) else v) for col, v in row.items()}
+        for row in out[COLUMNS].to_dict('records')
+    ]
+
+
+def test_label_dataframe_empty():
+    out = AutoLabeler().label_dataframe(pd.DataFrame({'binary_path': []}))
+    assert len(out) == 0
+    assert set(COLUMNS) <= set(out.columns)
+
+
+@pytest.mark.parametrize('paths', [
+    ['plain.bin', 'dir/other.bin'],          # nothing to split: columns 1-3 all NaN
+    ['bin/short_name.bin', 'plain.bin'],
+])
+def test_label_dataframe_all_invalid_paths(paths):
+    labeler = AutoLabeler()
+    out = labeler.label_dataframe(pd.DataFrame({'binary_path': paths}))
+    assert _rows(out) == [_expected(labeler, p) for p in paths]
+    assert out['algorithm'].tolist() == ['Unknown', 'Unknown']
+    assert not out['is_crypto'].any()
+
+
+def test_label_dataframe_matches_label_function():
+    labeler = AutoLabeler()
+    paths = [
+        'out/openssl_ECDSA-sign_x86_O2.bin',
+        'out/openssl_ECDSA-sign_x86_O2.bin',
+        'tiny_thing.bin',
+        'out/mbedtls_sha256-update_arm_O0.bin',
+        'out/lib_helper_mips_Os.bin',
+    ]
+    out = labeler.label_dataframe(pd.DataFrame({'binary_path': paths, 'address': range(5)}))
+    assert out['address'].tolist() == list(range(5))
+    assert _rows(out) == [_expected(labeler, p) for p in paths]
+    assert out['algorithm'].tolist() == ['ECDSA', 'ECDSA', 'Unknown', 'SHA-256', 'Unknown']
@@ -0,0 +1,117 @@
+# Hinglish: CrossCompiler ke batched compile aur cache restore ke liye tests.
+# Sirf native x86-64 gcc chahiye; cross toolchains ki zarurat nahi.
+
+import shutil
+
+import pytest
+
+from crypto_finder.dataset_builder.compiler.cross_compiler import CrossCompiler
+
+pytestmark = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+
+GOOD = "int {name}(int x) {{ return x * 3 + 1; }}\nint main(void) {{ return {name}(1) == 4 ? 0 : 1; }}\n"
+BROKEN = "int {name}(int x) {{ return x *; }}\n"
+
+
+@pytest.fixture
+def compiler(tmp_path, monkeypatch):
+    cc = CrossCompiler(str(tmp_path / "workspace"))
+    # Native build only, no ccache/lld: results must not depend on the host
+    cc.available_archs = ["x86-64"]
+    cc.ccache = None
+    cc.lld = None
+    monkeypatch.setattr(CrossCompiler, "OPTIMIZATION_LEVELS", ["-O0", "-O2"])
+    return cc
+
+
+@pytest.fixture
+def sources(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("alpha", "beta"):
+        (src / f"{name}.c").write_text(GOOD.format(name=name))
+    return src
+
+
+def test_compile_batch_keeps_objects_of_good_sources(compiler, sources, tmp_path):
+    (sources / "beta.c").write_text(BROKEN.format(name="beta"))
+    objects = compiler.compile_batch(
+        [str(sources / "alpha.c"), str(sources / "beta.c")], str(tmp_path / "objs"), "x86-64"
+    )
+    assert list(objects) == [str(sources / "alpha.c")]
+    assert objects[str(sources / "alpha.c")].name == "alpha.o"
+
+
+def test_compile_library_batches_and_links(compiler, sources, tmp_path):
+    results = compiler.compile_library("lib", str(sources), ["alpha", "beta"], str(tmp_path / "out"))
+    assert sorted(results) == [
+        ("x86-64", opt, name) for opt in ("-O0", "-O2") for name in ("alpha", "beta")
+    ]
+    for info in results.values():
+        assert info["size"] > 0
+
+
+def test_compile_library_ignores_stale_objects(compiler, sources, tmp_path):
+    out = str(tmp_path / "out")
+    assert len(compiler.compile_library("lib", str(sources), ["alpha", "beta"], out)) == 4
+
+    # Same batch dirs, but beta no longer compiles
+    (sources / "beta.c").write_text(BROKEN.format(name="beta"))
+    results = compiler.compile_library("lib", str(sources), ["alpha", "beta"], out)
+    assert sorted(k[2] for k in results) == ["alpha", "alpha"]
+
+
+def _count_batches(compiler, monkeypatch):
+    calls = []
+    original = compiler.compile_batch
+
+    def counting(sources, *args, **kwargs):
+        calls.append(list(sources))
+        return original(sources, *args, **kwargs)
+
+    monkeypatch.setattr(compiler, "compile_batch", counting)
+    return calls
+
+
+def test_compile_library_restores_unchanged_binaries(compiler, sources, tmp_path, monkeypatch):
+    out = tmp_path / "out"
+    first = compiler.compile_library("lib", str(sources), ["alpha", "beta"], str(out))
+    assert (out / "cache.json").exists()
+
+    calls = _count_batches(compiler, monkeypatch)
+    second = compiler.compile_library("lib", str(sources), ["alpha", "beta"], str(out))
+    assert calls == []
+    assert {k: v["binary_path"] for k, v in second.items()} == {
+        k: v["binary_path"] for k, v in first.items()
+    }
+
+
+def test_compile_library_rebuilds_changed_source(compiler, sources, tmp_path, monkeypatch):
+    out = str(tmp_path / "out")
+    compiler.compile_library("lib", str(sources), ["alpha", "beta"], out)
+
+    (sources / "beta.c").write_text(GOOD.format(name="beta").replace("x * 3", "x * 5"))
+    calls = _count_batches(compiler, monkeypatch)
+    results = compiler.compile_library("lib", str(sources), ["alpha", "beta"], out)
+    assert sorted(src for batch in calls for src in batch) == [str(sources / "beta.c")] * 2
+    assert len(results) == 4
+
+
+def test_single_source_batch_runs_from_source_dir(compiler, sources, tmp_path):
+    compiler.ccache = "/usr/bin/ccache"
+    cmd, env, out_path, cwd = compiler._batch_command(
+        [str(sources / "alpha.c")], str(tmp_path / "objs" / "0"), "x86-64", "-O2", "gcc", None
+    )
+    assert cmd[0] == "/usr/bin/ccache"
+    assert cwd == sources.resolve()
+    assert cmd[cmd.index("-o") + 1] == str(out_path.resolve() / "alpha.o")
+    assert env["CCACHE_BASEDIR"] == str(sources.resolve())
+
+
+def test_compile_file_does_not_wrap_link_in_ccache(compiler, sources, tmp_path):
+    compiler.ccache = "/usr/bin/ccache"
+    cmd, env = compiler._file_command(
+        str(sources / "alpha.c"), str(tmp_path / "alpha.bin"), "x86-64", "-O2", "gcc", None, False
+    )
+    assert "/usr/bin/ccache" not in cmd
+    assert env is None
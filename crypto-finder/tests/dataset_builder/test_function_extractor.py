@@ -0,0 +1,83 @@
+# Hinglish: FunctionExtractor ke symbol (pyelftools / readelf) aur heuristic raaston ke tests.
+
+import shutil
+import subprocess
+
+import pytest
+
+from crypto_finder.dataset_builder.extraction import function_extractor
+from crypto_finder.dataset_builder.extraction.function_extractor import FunctionExtractor
+
+pytestmark = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+
+SOURCE = """
+int crypto_round(int x) { return (x << 3) ^ (x >> 5) ^ 0x9e3779b9; }
+int main(void) { return crypto_round(7) & 1; }
+"""
+
+
+@pytest.fixture(scope="module")
+def binaries(tmp_path_factory):
+    root = tmp_path_factory.mktemp("extractor")
+    src = root / "prog.c"
+    src.write_text(SOURCE)
+    binary = root / "prog"
+    subprocess.run(
+        ["gcc", "-O0", "-fno-omit-frame-pointer", str(src), "-o", str(binary)],
+        check=True, capture_output=True,
+    )
+    stripped = root / "prog_stripped"
+    subprocess.run(["strip", "-o", str(stripped), str(binary)], check=True, capture_output=True)
+    return binary, stripped
+
+
+def _as_set(functions):
+    return {(f["name"], f["address"], f["size"], f["source"]) for f in functions}
+
+
+def test_pyelftools_finds_defined_functions(binaries):
+    pytest.importorskip("elftools")
+    functions = FunctionExtractor().extract_all(str(binaries[0]))
+    by_name = {f["name"]: f for f in functions}
+    for name in ("crypto_round", "main"):
+        assert by_name[name]["source"] == "symbol"
+        assert by_name[name]["address"] > 0
+        assert by_name[name]["size"] > 0
+
+
+def test_pyelftools_matches_readelf(binaries, monkeypatch):
+    pytest.importorskip("elftools")
+    if shutil.which("readelf") is None:
+        pytest.skip("readelf not installed")
+    extractor = FunctionExtractor()
+    with_elftools = extractor.extract_all(str(binaries[0]))
+    monkeypatch.setattr(function_extractor, "ELFFile", None)
+    with_readelf = extractor.extract_all(str(binaries[0]))
+    assert _as_set(with_elftools) == _as_set(with_readelf)
+
+
+def test_stripped_binary_falls_back_to_prologue_scan(binaries):
+    functions = FunctionExtractor().extract_all(str(binaries[1]))
+    assert functions
+    assert {f["source"] for f in functions} == {"heuristic"}
+    data = binaries[1].read_bytes()
+    for f in functions:
+        assert f["name"] == f"sub_{f['address']:x}"
+        assert function_extractor.PROLOGUE_PATTERN.match(data, f["address"])
+
+
+def test_non_elf_input(tmp_path):
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    text = tmp_path / "text"
+    text.write_bytes(b"not an elf file")
+    extractor = FunctionExtractor()
+    assert extractor.extract_all(str(empty)) == []
+    assert extractor.extract_all(str(text)) == []
+
+
+def test_extract_all_batch_matches_serial(binaries):
+    paths = [str(binaries[0]), str(binaries[1])] * 2
+    extractor = FunctionExtractor()
+    batch = extractor.extract_all_batch(paths, max_workers=2, chunksize=1)
+    assert batch == {path: extractor.extract_all(path) for path in paths}
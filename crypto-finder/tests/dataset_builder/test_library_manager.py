@@ -0,0 +1,175 @@
+# Hinglish: LibraryManager ke download (single stream / segmented) aur extraction ke tests.
+# Network nahi chahiye: requests.Session ki jagah ek nakli session use hota hai.
+
+import io
+import stat
+import tarfile
+
+import pytest
+import requests
+
+from crypto_finder.dataset_builder.compiler import library_manager
+from crypto_finder.dataset_builder.compiler.library_manager import LibraryManager
+
+URL = "https://example.org/dl/lib-1.0.tar.gz"
+
+
+class FakeResponse:
+    def __init__(self, body, status=200, headers=None, chunk=7):
+        self.body = body
+        self.status_code = status
+        self.headers = headers or {}
+        self.ok = status < 400
+        self.url = URL
+        self.chunk = chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), self.chunk):
+            yield self.body[i:i + self.chunk]
+
+
+class FakeSession:
+    """
+    Serves one body; honours Range unless told otherwise
+    """
+
+    def __init__(self, body, ranges=True, range_status=206, short_by=0):
+        self.body = body
+        self.ranges = ranges
+        self.range_status = range_status
+        self.short_by = short_by
+        self.requested = []
+
+    def head(self, url, **kwargs):
+        headers = {"content-length": str(len(self.body))}
+        if self.ranges:
+            headers["accept-ranges"] = "bytes"
+        return FakeResponse(b"", headers=headers)
+
+    def get(self, url, headers=None, **kwargs):
+        rng = (headers or {}).get("Range")
+        self.requested.append(rng)
+        if rng is None or self.range_status != 206:
+            return FakeResponse(self.body, headers={"content-length": str(len(self.body))})
+        lo, hi = map(int, rng[len("bytes="):].split("-"))
+        part = self.body[lo:hi + 1]
+        if self.short_by and lo > 0:
+            part = part[:-self.short_by]
+        return FakeResponse(part, status=206)
+
+
+def _digest(data):
+    h, algo = LibraryManager._new_hasher()
+    h.update(data)
+    return f"{algo}:{h.hexdigest()}"
+
+
+@pytest.fixture
+def body():
+    return bytes(range(256)) * 40 + b"tail"  # 10244 bytes
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(library_manager, "SEGMENTED_MIN_SIZE", 1024)
+    return LibraryManager(str(tmp_path / "sources"))
+
+
+def test_segmented_download_covers_file_exactly(manager, body):
+    manager.session = FakeSession(body)
+    path, digest = manager._download_file(URL, segments=8)
+
+    assert path.read_bytes() == body
+    assert digest == _digest(body)
+    spans = sorted(tuple(map(int, r[len("bytes="):].split("-"))) for r in manager.session.requested)
+    assert len(spans) == 8
+    assert spans[0][0] == 0 and spans[-1][1] == len(body) - 1
+    assert all(nxt[0] == cur[1] + 1 for cur, nxt in zip(spans, spans[1:]))
+
+
+@pytest.mark.parametrize("segments", [3, 64])
+def test_segment_counts_that_do_not_divide_size(manager, body, segments):
+    manager.session = FakeSession(body)
+    path, digest = manager._download_file(URL, segments=segments)
+    assert path.read_bytes() == body
+    assert digest == _digest(body)
+
+
+@pytest.mark.parametrize("session_kwargs", [
+    {"range_status": 200},  # server ignores Range
+    {"short_by": 5},        # a segment comes back short
+])
+def test_bad_ranges_fall_back_to_one_stream(manager, body, session_kwargs):
+    manager.session = FakeSession(body, **session_kwargs)
+    path, digest = manager._download_file(URL, segments=4)
+
+    assert manager.session.requested[-1] is None
+    assert path.read_bytes() == body
+    assert digest == _digest(body)
+
+
+@pytest.mark.parametrize("session_kwargs, size", [({"ranges": False}, None), ({}, 10)])
+def test_small_or_unranged_files_use_one_stream(manager, monkeypatch, session_kwargs, size):
+    data = b"x" * 2000
+    if size is not None:
+        monkeypatch.setattr(library_manager, "SEGMENTED_MIN_SIZE", 4096)
+    manager.session = FakeSession(data, **session_kwargs)
+    path, digest = manager._download_file(URL)
+
+    assert manager.session.requested == [None]
+    assert path.read_bytes() == data
+    assert digest == _digest(data)
+
+
+def _tarball(path):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        payload = b"int aes(void) { return 0; }\n"
+        info = tarfile.TarInfo("lib-1.0/aes.c")
+        info.size = len(payload)
+        tar.addfile(info, io.BytesIO(payload))
+    path.write_bytes(buf.getvalue())
+    return buf.getvalue()
+
+
+def _fake_tool(bin_dir, name, body):
+    tool = bin_dir / name
+    tool.write_text("#!/bin/sh\n" + body)
+    tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+
+
+@pytest.mark.parametrize("tools", [{}, {"tar": "exit 2\n", "pigz": "exit 0\n"}])
+def test_extract_falls_back_to_tarfile(manager, tmp_path, monkeypatch, tools):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, script in tools.items():
+        _fake_tool(bin_dir, name, script)
+    # Only the fake tools (or none at all) are visible
+    monkeypatch.setenv("PATH", str(bin_dir))
+    archive = tmp_path / "lib-1.0.tar.gz"
+    _tarball(archive)
+
+    manager._extract_archive(archive, tmp_path / "out")
+    assert (tmp_path / "out" / "lib-1.0" / "aes.c").exists()
+
+
+def test_get_library_records_archive_hash(manager, tmp_path):
+    archive = _tarball(tmp_path / "src.tar.gz")
+    manager.session = FakeSession(archive, ranges=False)
+
+    lib_dir = manager.get_library("lib", "1.0", URL)
+
+    assert (tmp_path / "sources" / "lib-1.0" / "aes.c").exists()
+    assert lib_dir == str(tmp_path / "sources" / "lib-1.0")
+    assert manager.get_archive_hash("lib", "1.0") == _digest(archive)
+    assert not (tmp_path / "sources" / "lib-1.0.tar.gz").exists()
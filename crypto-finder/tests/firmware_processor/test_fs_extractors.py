@@ -0,0 +1,101 @@
+# Hinglish: fs_extractors.dispatch ke liye tests, nakli extractor scripts ke saath.
+
+import stat
+
+import pytest
+
+from crypto_finder.firmware_processor.unpacker import fs_extractors
+
+
+def _fake_tool(bin_dir, name, body):
+    tool = bin_dir / name
+    tool.write_text("#!/bin/sh\n" + body)
+    tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+
+
+@pytest.fixture
+def bin_dir(tmp_path, monkeypatch):
+    d = tmp_path / "bin"
+    d.mkdir()
+    # Only the fake tools are visible; real ones would change the outcome
+    monkeypatch.setenv("PATH", str(d))
+    return d
+
+
+@pytest.fixture
+def fake_unsquashfs(bin_dir):
+    # argv: -no-progress -f -d <dest> <src>
+    _fake_tool(bin_dir, "unsquashfs", (
+        '[ -f "$5" ] || { echo "src missing" >&2; exit 1; }\n'
+        'echo extracted > "$4/file.txt"\n'
+    ))
+
+
+def test_dispatch_resolves_relative_root(tmp_path, monkeypatch, fake_unsquashfs):
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "img.sqfs").write_bytes(b"hsqs" + b"\0" * 60)
+    monkeypatch.chdir(tmp_path)
+
+    created = fs_extractors.dispatch(fs_extractors.Path("out"), 64)
+
+    dest = tmp_path / "out" / "_img.sqfs.fs"
+    assert created == [dest]
+    assert (dest / "file.txt").read_text() == "extracted\n"
+
+
+def test_dispatch_skips_failed_extraction(tmp_path, bin_dir):
+    _fake_tool(bin_dir, "unsquashfs", 'echo "bad image" >&2\nexit 1\n')
+    (tmp_path / "img.sqfs").write_bytes(b"hsqs" + b"\0" * 60)
+
+    assert fs_extractors.dispatch(tmp_path, 64) == []
+    assert not (tmp_path / "_img.sqfs.fs").exists()
+
+
+def test_dispatch_skips_missing_tools(tmp_path, bin_dir):
+    (tmp_path / "img.ubi").write_bytes(b"UBI#" + b"\0" * 60)
+    assert fs_extractors.dispatch(tmp_path, 64) == []
+
+
+def test_dispatch_recurses_and_dedups(tmp_path, bin_dir):
+    # Every cpio image unpacks to a text file plus the same nested image
+    _fake_tool(bin_dir, "cpio", 'echo nested > inner.txt\nprintf 070702zz > inner.cpio\n')
+    (tmp_path / "a.cpio").write_bytes(b"070701xx")
+    (tmp_path / "copy.bin").write_bytes(b"070701xx")
+
+    created = fs_extractors.dispatch(tmp_path, 1 << 20)
+
+    # Two distinct images: the outer one (extracted once) and the nested one
+    assert len(created) == 2
+    assert created[1].parent == created[0]
+    assert (created[1] / "inner.txt").exists()
+
+
+def test_dispatch_stops_at_size_cap(tmp_path, bin_dir):
+    _fake_tool(bin_dir, "cpio", "printf '%04096d' 0 > big.bin\n")
+    for i in range(3):
+        (tmp_path / f"{i}.cpio").write_bytes(b"070701" + bytes([i]))
+
+    # Budget of 8 * 100 bytes is spent by the first extraction
+    assert len(fs_extractors.dispatch(tmp_path, 100)) == 1
+
+
+@pytest.mark.parametrize("sibling", ["squashfs-root", "squashfs-root-0", "_1A0.squashfs.extracted"])
+def test_dispatch_skips_images_binwalk_unpacked(tmp_path, fake_unsquashfs, sibling):
+    # binwalk -Me output: the carved image plus the tree it unpacked from it
+    (tmp_path / "1A0.squashfs").write_bytes(b"hsqs" + b"\0" * 60)
+    (tmp_path / sibling).mkdir()
+    (tmp_path / sibling / "busybox").write_bytes(b"\x7fELF")
+    # A second image binwalk left alone is still extracted
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "2F0.squashfs").write_bytes(b"hsqs" + b"\1" * 60)
+
+    created = fs_extractors.dispatch(tmp_path, 1 << 20)
+
+    assert created == [tmp_path / "sub" / "_2F0.squashfs.fs"]
+    assert not (tmp_path / "_1A0.squashfs.fs").exists()
+
+
+def test_binwalk_root_of_other_kind_does_not_skip(tmp_path, fake_unsquashfs):
+    (tmp_path / "img.sqfs").write_bytes(b"hsqs" + b"\0" * 60)
+    (tmp_path / "jffs2-root").mkdir()
+    assert fs_extractors.dispatch(tmp_path, 1 << 20) == [tmp_path / "_img.sqfs.fs"]
@@ -0,0 +1,118 @@
+# Hinglish: AngrAdapter ke CFG cache aur listing cache ke tests, nakli 'angr' module ke saath.
+
+import sys
+import types
+
+import pytest
+
+from crypto_finder.common import cache
+
+
+class _Node:
+    def __init__(self, addr, size):
+        self.addr = addr
+        self.size = size
+
+
+class _Graph:
+    def __init__(self, nodes):
+        self._nodes = nodes
+
+    def nodes(self):
+        return list(self._nodes)
+
+
+class _Function:
+    def __init__(self, name, addr, size, blocks):
+        self.name = name
+        self.addr = addr
+        self.size = size
+        self.graph = _Graph([_Node(a, s) for a, s in blocks])
+
+
+def _stub_angr(projects):
+    """
+    Fake angr whose Project records every binary it is built for
+    """
+    def project(path, auto_load_libs=True):
+        projects.append(path)
+        functions = {
+            0x1000: _Function("main", 0x1000, 32, [(0x1010, 16), (0x1000, 16)]),
+            0x2000: _Function("aes_round", 0x2000, 64, [(0x2000, 64)]),
+        }
+        cfg = types.SimpleNamespace(kb=types.SimpleNamespace(functions=functions))
+        analyses = types.SimpleNamespace(CFGFast=lambda normalize=False: cfg)
+        return types.SimpleNamespace(analyses=analyses)
+
+    return types.SimpleNamespace(Project=project)
+
+
+@pytest.fixture
+def projects(tmp_path, monkeypatch):
+    built = []
+    monkeypatch.setitem(sys.modules, "angr", _stub_angr(built))
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    return built
+
+
+@pytest.fixture
+def binaries(tmp_path):
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"bin{i}"
+        p.write_bytes(b"\x7fELF" + bytes([i]) * 16)
+        paths.append(p)
+    return paths
+
+
+def _adapter(**kwargs):
+    from crypto_finder.lifter.adapters.angr import AngrAdapter
+    adapter = AngrAdapter(**kwargs)
+    assert adapter.available
+    return adapter
+
+
+def test_get_function_and_iter_blocks(projects, binaries):
+    adapter = _adapter()
+    assert adapter.get_function(binaries[0], 0x2000) == {'name': 'aes_round', 'address': 0x2000, 'size': 64}
+    assert adapter.get_function(binaries[0], 0x3000) is None
+    assert list(adapter.iter_blocks(binaries[0], 0x1000)) == [
+        {'address': 0x1000, 'size': 16},
+        {'address': 0x1010, 'size': 16},
+    ]
+    assert list(adapter.iter_blocks(binaries[0], 0x3000)) == []
+    # One CFG answers every query on the same binary
+    assert projects == [str(binaries[0])]
+
+
+def test_cfg_cache_is_bounded_lru(projects, binaries):
+    adapter = _adapter(max_projects=2)
+    adapter.get_function(binaries[0], 0x1000)
+    adapter.get_function(binaries[1], 0x1000)
+    adapter.get_function(binaries[0], 0x1000)  # bin0 now most recent
+    adapter.get_function(binaries[2], 0x1000)  # evicts bin1
+    assert list(adapter._cache) == [binaries[0], binaries[2]]
+
+    adapter.get_function(binaries[1], 0x1000)
+    assert projects == [str(binaries[i]) for i in (0, 1, 2, 1)]
+
+    adapter.evict(binaries[1])
+    adapter.evict(binaries[1])  # unknown paths are ignored
+    assert binaries[1] not in adapter._cache
+
+
+def test_listing_cached_on_disk_by_content(projects, binaries):
+    expected = [
+        {'name': 'main', 'address': 0x1000, 'size': 32},
+        {'name': 'aes_round', 'address': 0x2000, 'size': 64},
+    ]
+    assert _adapter().list_functions(binaries[0]) == expected
+
+    # A fresh adapter (new run) reads the listing back without building a CFG
+    assert _adapter().list_functions(binaries[0]) == expected
+    assert len(projects) == 1
+
+    # Rebuilt binary at the same path: new digest, so angr runs again
+    binaries[0].write_bytes(b"\x7fELF rebuilt")
+    assert _adapter().list_functions(binaries[0]) == expected
+    assert len(projects) == 2
@@ -0,0 +1,102 @@
+# Hinglish: fused feature extraction ko per-extractor functions se match karne ke tests.
+# torch ki zarurat nahi, sirf numpy aur pyahocorasick.
+
+import numpy as np
+import pytest
+
+from crypto_finder.ml.features import fused
+from crypto_finder.ml.features.constants import constant_hits
+from crypto_finder.ml.features.embeddings import byte_ngram_embedding
+from crypto_finder.ml.features.statistical import compute_byte_histogram, summarize_bytes
+from crypto_finder.ml.features.structural import basic_structural_features
+
+SBOX_HEAD = bytes([0x63, 0x7C, 0x77, 0x7B, 0xF2, 0x6B, 0x6F, 0xC5])
+
+
+def _blobs():
+    rng = np.random.default_rng(0)
+    return [
+        b"",
+        b"\x00",
+        b"\x90" * 31,
+        bytes(range(256)),
+        rng.integers(0, 256, 300, dtype=np.uint8).tobytes(),
+        rng.integers(0, 256, 5000, dtype=np.uint8).tobytes(),
+        b"\x55\x48\x89\xe5" + SBOX_HEAD * 4 + b"\xc3",
+    ]
+
+
+def _reference(data, num_bins=16, ngram_n=2):
+    expected = {}
+    expected.update(summarize_bytes(data))
+    expected.update(basic_structural_features(data))
+    expected.update((f"hist_{i}", v) for i, v in enumerate(compute_byte_histogram(data, num_bins)))
+    expected.update((k, float(v)) for k, v in constant_hits(data).items())
+    expected.update(byte_ngram_embedding(data, ngram_n))
+    return expected
+
+
+def _assert_same(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        assert actual[key] == pytest.approx(expected[key], abs=1e-9), key
+
+
+@pytest.mark.parametrize("index", range(len(_blobs())))
+@pytest.mark.parametrize("ngram_n", [1, 2, 3])
+def test_extract_all_matches_individual_extractors(index, ngram_n):
+    data = _blobs()[index]
+    _assert_same(fused.extract_all(data, ngram_n=ngram_n), _reference(data, ngram_n=ngram_n))
+
+
+@pytest.mark.parametrize("num_bins", [16, 10])
+def test_extract_columns_matches_extract_all(num_bins):
+    blobs = _blobs()
+    columns = fused._extract_columns(blobs, num_bins=num_bins)
+    for i, data in enumerate(blobs):
+        single = fused.extract_all(data, num_bins=num_bins)
+        row = {key: float(col[i]) for key, col in columns.items()}
+        _assert_same(row, {k: v for k, v in single.items() if not k.startswith("ng_")})
+
+
+def test_extract_columns_empty():
+    assert fused._extract_columns([]) == {}
+
+
+def test_extract_records_and_extract_into_agree():
+    blobs = _blobs()
+    records = fused.extract_records(blobs)
+    assert records.dtype == fused.FEATURE_DTYPE
+    one_by_one = np.zeros(len(blobs), dtype=fused.FEATURE_DTYPE)
+    for i, data in enumerate(blobs):
+        fused.extract_into(one_by_one[i], data)
+
+    for i, data in enumerate(blobs):
+        ref = _reference(data)
+        for got in (records[i], one_by_one[i]):
+            assert got["size"] == ref["size_bytes"]
+            for name in ("is_tiny", "is_large", "mean", "entropy"):
+                assert got[name] == pytest.approx(ref[name], rel=1e-6, abs=1e-6), name
+            for name in fused.FEATURE_DTYPE.names:
+                if name.startswith("const_"):
+                    assert got[name] == ref[name], name
+            np.testing.assert_allclose(
+                got["hist"], [ref[f"hist_{b}"] for b in range(fused.HIST_BINS)], rtol=1e-6
+            )
+    assert len(fused.extract_records([])) == 0
+
+
+def test_extract_all_parallel_matches_serial():
+    # Repeat so several workers each get a range
+    blobs = _blobs() * 6
+    serial = [fused.extract_all(b) for b in blobs]
+    parallel = fused.extract_all_parallel(blobs, max_workers=3, min_parallel=1)
+    assert len(parallel) == len(serial)
+    for got, expected in zip(parallel, serial):
+        _assert_same(got, expected)
+
+
+def test_extract_all_parallel_all_empty_blobs():
+    assert fused.extract_all_parallel([b""] * 4, max_workers=2, min_parallel=1) == [
+        fused.extract_all(b"") for _ in range(4)
+    ]
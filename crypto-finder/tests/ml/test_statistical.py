@@ -0,0 +1,30 @@
+# Hinglish: statistical features ke entropy lookup table ko seedhe log2 se match karne ke tests.
+
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from crypto_finder.ml.features.statistical import _LUT_MAX_N, shannon_entropy
+
+
+def _naive_entropy(data):
+    n = len(data)
+    return -sum(c / n * math.log2(c / n) for c in Counter(data).values()) if n else 0.0
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 17, _LUT_MAX_N - 1, _LUT_MAX_N, _LUT_MAX_N + 1, 4096])
+def test_shannon_entropy_matches_naive(length):
+    rng = np.random.default_rng(length)
+    for data in (
+        rng.integers(0, 256, length, dtype=np.uint8).tobytes(),
+        rng.integers(0, 4, length, dtype=np.uint8).tobytes(),
+        b"\xaa" * length,
+    ):
+        assert shannon_entropy(data) == pytest.approx(_naive_entropy(data), abs=1e-12)
+
+
+def test_shannon_entropy_extremes():
+    assert shannon_entropy(bytes(range(256))) == pytest.approx(8.0)
+    assert shannon_entropy(b"\x00" * 100) == 0.0
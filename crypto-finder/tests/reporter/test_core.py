@@ -0,0 +1,49 @@
+# Hinglish: ReportGenerator ke detections.json aur HTML output ke liye tests.
+
+import json
+
+import numpy as np
+import pytest
+
+from crypto_finder.reporter import core
+from crypto_finder.reporter.core import ReportGenerator
+
+DETECTIONS = [
+    {'function': 'aes_encrypt', 'label': 'crypto', 'confidence': np.float64(0.5)},
+    {'function': 'sub_401000', 'label': 'non-crypto', 'confidence': np.float64(0.25)},
+    {'function': 'schlüssel <script>', 'label': 'crypto', 'confidence': 0.75},
+]
+
+# Values plain json accepted that orjson rejects without options or at all
+AWKWARD = [
+    {'function': {1: 'non-str key'}, 'label': 'crypto', 'confidence': 1.0},
+    {'function': 'big', 'label': 'crypto', 'confidence': 2 ** 70},
+]
+
+
+def _expected(detections):
+    return json.loads(json.dumps(detections))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_detections_json_round_trips(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(core, "orjson", None)
+    ReportGenerator(str(tmp_path)).generate_report(DETECTIONS, "fw.bin")
+    assert json.loads((tmp_path / "detections.json").read_text(encoding="utf-8")) == _expected(DETECTIONS)
+
+
+@pytest.mark.parametrize("detection", AWKWARD)
+def test_values_stdlib_json_accepted_still_serialize(tmp_path, detection):
+    ReportGenerator(str(tmp_path)).generate_report([detection], "fw.bin")
+    assert json.loads((tmp_path / "detections.json").read_text()) == _expected([detection])
+
+
+def test_html_rows_are_escaped(tmp_path):
+    path = ReportGenerator(str(tmp_path)).generate_report(DETECTIONS[-1:], "<fw>.bin")
+    page = open(path, encoding="utf-8").read()
+    assert "&lt;fw&gt;.bin" in page
+    assert "schlüssel &lt;script&gt;" in page
+    assert "<script>" not in page
@@ -0,0 +1,37 @@
+# Hinglish: window_entropy heuristic ko har window ke seedhe entropy calculation se match karne ke tests.
+
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from crypto_finder.static_scanner.heuristics.entropy import window_entropy
+
+
+def _naive(data, window, step, threshold):
+    hits = []
+    for start in range(0, len(data) - window + 1, step):
+        chunk = data[start:start + window]
+        ent = -sum(c / window * math.log2(c / window) for c in Counter(chunk).values())
+        if ent >= threshold:
+            hits.append((start, ent))
+    return hits
+
+
+@pytest.mark.parametrize("window, step", [(256, 64), (64, 16), (100, 7)])
+def test_window_entropy_matches_naive(window, step):
+    rng = np.random.default_rng(window)
+    # Low-entropy padding around a random "key" region
+    data = b"\x00" * 700 + rng.integers(0, 256, 1500, dtype=np.uint8).tobytes() + b"\xff" * 300
+    threshold = 0.8 * math.log2(window)
+    got = window_entropy(data, window=window, step=step, threshold=threshold)
+    expected = _naive(data, window, step, threshold)
+    assert expected
+    assert [start for start, _ in got] == [start for start, _ in expected]
+    for (_, ent), (_, ref) in zip(got, expected):
+        assert ent == pytest.approx(ref, abs=1e-9)
+
+
+def test_window_entropy_short_input():
+    assert window_entropy(b"\x01" * 10, window=256) == []
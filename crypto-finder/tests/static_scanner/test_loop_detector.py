@@ -0,0 +1,31 @@
+# Hinglish: loop_detector ke vectorized jump search ke liye tests.
+
+import numpy as np
+
+from crypto_finder.static_scanner.heuristics.loop_detector import detect_simple_loops
+
+
+def _naive(opcodes):
+    return [{'at': i, 'type': 'backedge'} for i, op in enumerate(opcodes) if op == 0xE9]
+
+
+def test_bytes_and_int_sequences_agree():
+    code = bytes(np.random.default_rng(1).integers(0, 256, 2000, dtype=np.uint8))
+    expected = _naive(code)
+    assert expected
+    assert detect_simple_loops(code) == expected
+    assert detect_simple_loops(bytearray(code)) == expected
+    assert detect_simple_loops(memoryview(code)) == expected
+    assert detect_simple_loops(list(code)) == expected
+
+
+def test_positions_are_plain_ints():
+    hits = detect_simple_loops(b"\x90\xe9\x00\xe9")
+    assert hits == [{'at': 1, 'type': 'backedge'}, {'at': 3, 'type': 'backedge'}]
+    assert all(type(h['at']) is int for h in hits)
+
+
+def test_no_jumps_or_empty_input():
+    assert detect_simple_loops(b"") == []
+    assert detect_simple_loops([]) == []
+    assert detect_simple_loops(b"\x90" * 64) == []
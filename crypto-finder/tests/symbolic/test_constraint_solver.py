@@ -0,0 +1,50 @@
+# Hinglish: constraint_solver ke whitelist aur bool rewrite ke liye tests.
+
+import pytest
+
+from crypto_finder.symbolic.constraint_solver import _compile_constraint, check_satisfiable
+
+z3 = pytest.importorskip("z3")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    check_satisfiable.cache_clear()
+    yield
+    check_satisfiable.cache_clear()
+
+
+@pytest.mark.parametrize("constraints, expected", [
+    (["x > 0 and x < 0"], False),
+    (["x > 0 or x < 0", "x == 0"], False),
+    (["not (x == 1)", "x * x == 1"], True),
+    (["0 < x < 2", "x != 1"], False),
+    (["0 < x <= y < 3", "x == y"], True),
+    (["p and not q", "q or not p"], False),
+])
+def test_python_bool_syntax_maps_to_z3(constraints, expected):
+    decls = [("x", "int"), ("y", "int"), ("p", "bool"), ("q", "bool")]
+    assert check_satisfiable(decls, constraints) is expected
+
+
+def test_bitvector_constraints():
+    decls = [("a", "bv8")]
+    assert check_satisfiable(decls, ["ULT(a, 4) and a * 2 == 6"]) is True
+    assert check_satisfiable(decls, ["ULT(a, 4) and UGT(a, 10)"]) is False
+
+
+@pytest.mark.parametrize("src", [
+    "x.__class__",
+    "__import__('os')",
+    "_x > 0",
+    "[x for x in y]",
+    "x[0]",
+])
+def test_rejects_disallowed_syntax(src):
+    with pytest.raises(ValueError):
+        _compile_constraint(src)
+
+
+def test_rewrite_names_are_not_reachable():
+    with pytest.raises(ValueError):
+        _compile_constraint("__And(x, x)")